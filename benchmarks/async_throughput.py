@@ -0,0 +1,167 @@
+# Copyright Sierra
+
+import os
+
+os.environ.setdefault("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from aiohttp import web
+
+from tau_bench.agents.tool_calling_agent import ToolCallingAgent
+from tau_bench.envs import get_env
+from tau_bench.envs.base import Env
+
+
+def scripted_message(request: Dict[str, Any], num_turns: int) -> Dict[str, Any]:
+    """Plays both sides of an episode: the agent thinks once, then answers; the
+    user stops after `num_turns` answers."""
+    messages = request["messages"]
+    if "tools" in request:
+        if messages[-1]["role"] == "user":
+            arguments = json.dumps({"thought": "Let me look into this."})
+            return {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"call_{len(messages)}",
+                        "type": "function",
+                        "function": {"name": "think", "arguments": arguments},
+                    }
+                ],
+            }
+        return {"role": "assistant", "content": "Is there anything else I can help with?"}
+    turns = sum(1 for message in messages if message["role"] == "assistant")
+    content = "###STOP###" if turns >= num_turns else "I would like some help with my order."
+    return {"role": "assistant", "content": content}
+
+
+def serve(port: int, latency: float, num_turns: int, ready: Any) -> None:
+    async def chat_completions(request: web.Request) -> web.Response:
+        body = await request.json()
+        await asyncio.sleep(latency)
+        return web.json_response(
+            {
+                "id": "chatcmpl-local",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": scripted_message(body, num_turns),
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 100, "completion_tokens": 10, "total_tokens": 110},
+            }
+        )
+
+    async def start() -> None:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", chat_completions)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", port, backlog=4096).start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(start())
+
+
+class PeakThreads(object):
+    def __init__(self) -> None:
+        self.peak = threading.active_count()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+
+    def sample(self) -> None:
+        while not self.stopped.wait(0.01):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self) -> "PeakThreads":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stopped.set()
+        self.thread.join()
+
+
+def run_threads(env: Env, agent: ToolCallingAgent, task_indices: List[int], concurrency: int) -> float:
+    def run(task_index: int) -> float:
+        return agent.solve(env.new_episode(task_index=task_index), task_index=task_index).reward
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return sum(executor.map(run, task_indices))
+
+
+def run_async(env: Env, agent: ToolCallingAgent, task_indices: List[int], concurrency: int) -> float:
+    async def run(task_index: int, semaphore: asyncio.Semaphore) -> float:
+        async with semaphore:
+            episode = env.new_episode(task_index=task_index)
+            return (await agent.asolve(episode, task_index=task_index)).reward
+
+    async def run_all() -> List[float]:
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(*(run(i, semaphore) for i in task_indices))
+
+    return sum(asyncio.run(run_all()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Episodes per second of the thread and asyncio runners against a local stand-in LLM server"
+    )
+    parser.add_argument("--env", type=str, default="retail", choices=["retail", "airline"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--num-episodes", type=int, default=None, help="Defaults to max(concurrency, 100)")
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds the server waits per request")
+    parser.add_argument("--num-turns", type=int, default=2, help="User turns per episode")
+    parser.add_argument("--port", type=int, default=8711)
+    args = parser.parse_args()
+
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(
+        target=serve, args=(args.port, args.latency, args.num_turns, ready), daemon=True
+    )
+    server.start()
+    ready.wait()
+    os.environ["OPENAI_API_KEY"] = "sk-local"
+    os.environ["OPENAI_BASE_URL"] = os.environ["OPENAI_API_BASE"] = f"http://127.0.0.1:{args.port}/v1"
+
+    env = get_env(args.env, user_strategy="llm", user_model="gpt-4o", user_provider="openai", task_split="test")
+    agent = ToolCallingAgent(tools_info=env.tools_info, wiki=env.wiki, model="gpt-4o", provider="openai")
+    # warm up connections and the ground-truth hash cache
+    run_async(env, agent, list(range(10)), 10)
+    # one reset, then per user turn: a tool call, an answer and the user's reply
+    calls_per_episode = 1 + 3 * args.num_turns
+
+    print(f"env={args.env} latency={args.latency * 1e3:.0f}ms llm calls/episode={calls_per_episode}")
+    print(f"{'concurrency':>11s} {'runner':>7s} {'episodes':>9s} {'seconds':>8s} {'episodes/s':>11s} {'calls/s':>8s} {'peak threads':>13s}")
+    for concurrency in args.concurrency:
+        num_episodes = args.num_episodes or max(concurrency, 100)
+        task_indices = [i % len(env.tasks) for i in range(num_episodes)]
+        for name, func in [("thread", run_threads), ("async", run_async)]:
+            with PeakThreads() as threads:
+                start = time.perf_counter()
+                reward = func(env, agent, task_indices, concurrency)
+                elapsed = time.perf_counter() - start
+            assert reward >= 0
+            print(
+                f"{concurrency:11d} {name:>7s} {num_episodes:9d} {elapsed:8.2f} "
+                f"{num_episodes / elapsed:11.1f} {num_episodes * calls_per_episode / elapsed:8.0f} {threads.peak:13d}"
+            )
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
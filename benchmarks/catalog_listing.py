@@ -0,0 +1,55 @@
+# Copyright Sierra
+
+import argparse
+import time
+from typing import Any, Dict
+
+from tau_bench.envs.db import Snapshot, copy_json
+from tau_bench.envs.retail.data import load_data
+from tau_bench.envs.retail.tools.list_all_product_types import ListAllProductTypes
+
+
+def scale_products(data: Dict[str, Any], factor: int) -> Dict[str, Any]:
+    # replicas of every product type with distinct ids and names
+    products = {}
+    for i in range(factor):
+        for product_id, product in data["products"].items():
+            product = copy_json(product)
+            if i:
+                product["product_id"] = f"{product_id}{i}"
+                product["name"] = f"{product['name']} {i}"
+            products[product["product_id"]] = product
+    return {**data, "products": products}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="list_all_product_types: rebuilt per call vs derived once per snapshot"
+    )
+    parser.add_argument("--factors", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    base = load_data()
+    for factor in args.factors:
+        data = scale_products(base, factor)
+        db = Snapshot(data).checkout()
+        # an episode that looked up (and so copied) a product for an exchange
+        db["products"][next(iter(data["products"]))]
+        plain = {name: dict(table.items()) for name, table in db.items()}
+        timings = {}
+        for name, tables in [("rebuilt", plain), ("derived", db)]:
+            ListAllProductTypes.invoke(tables)
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                ListAllProductTypes.invoke(tables)
+            timings[name] = (time.perf_counter() - start) / args.repeat
+        assert ListAllProductTypes.invoke(plain) == ListAllProductTypes.invoke(db)
+        print(
+            f"{len(data['products']):6d} products rebuilt {timings['rebuilt'] * 1e6:9.1f} us | "
+            f"derived {timings['derived'] * 1e6:6.1f} us ({timings['rebuilt'] / timings['derived']:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Copyright Sierra
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from tau_bench.checkpoint import CheckpointWriter, load_checkpoint
+from tau_bench.types import EnvRunResult
+
+
+def make_result(task_id: int, num_messages: int) -> EnvRunResult:
+    traj = [
+        {"role": "user" if i % 2 else "assistant", "content": f"message {i} " + "x" * 400}
+        for i in range(num_messages)
+    ]
+    return EnvRunResult(task_id=task_id, reward=1.0, info={"task": {"user_id": "u"}}, traj=traj, trial=0)
+
+
+def rewrite_json(path: str, results: List[EnvRunResult], workers: int) -> None:
+    lock = threading.Lock()
+
+    def save(result: EnvRunResult) -> None:
+        with lock:
+            data = []
+            if os.path.exists(path):
+                with open(path, "r") as f:
+                    data = json.load(f)
+            with open(path, "w") as f:
+                json.dump(data + [result.model_dump()], f, indent=2)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(save, results))
+
+
+def append_jsonl(path: str, results: List[EnvRunResult], workers: int) -> None:
+    with CheckpointWriter(path) as writer:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(writer.write, results))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Checkpoint N results: rewrite the whole JSON file per result vs append to a JSON Lines checkpoint"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 5000])
+    parser.add_argument("--num-messages", type=int, default=30, help="Messages per trajectory")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--max-rewrite", type=int, default=500, help="Skip the quadratic rewrite above this many results")
+    args = parser.parse_args()
+
+    methods: List[tuple] = [
+        ("rewrite .json", ".json", rewrite_json),
+        ("append .jsonl", ".jsonl", append_jsonl),
+        ("append .jsonl.gz", ".jsonl.gz", append_jsonl),
+    ]
+    print(f"{'results':>8s} {'method':>17s} {'seconds':>9s} {'ms/result':>10s} {'MB':>8s}")
+    for size in args.sizes:
+        results = [make_result(i, args.num_messages) for i in range(size)]
+        for name, suffix, func in methods:
+            if name.startswith("rewrite") and size > args.max_rewrite:
+                print(f"{size:8d} {name:>17s} {'skipped':>9s}")
+                continue
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "checkpoint" + suffix)
+                start = time.perf_counter()
+                func(path, results, args.workers)
+                elapsed = time.perf_counter() - start
+                assert len(load_checkpoint(path)) == size
+                mb = os.path.getsize(path) / 1e6
+            print(f"{size:8d} {name:>17s} {elapsed:9.3f} {elapsed / size * 1e3:10.3f} {mb:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
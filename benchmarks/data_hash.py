@@ -0,0 +1,46 @@
+# Copyright Sierra
+
+import argparse
+import time
+from typing import Callable
+
+from tau_bench.envs.airline.data import load_data as load_airline_data
+from tau_bench.envs.db import consistent_hash, load_snapshot, to_hashable
+from tau_bench.envs.retail.data import load_data as load_retail_data
+
+
+def timeit(func: Callable[[], str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare the full to_hashable/sha256 data hash with the incremental digest"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    for env_name, data_load_func, table, key in [
+        ("retail", load_retail_data, "orders", "#W2378156"),
+        ("airline", load_airline_data, "reservations", "4WQ150"),
+    ]:
+        data = data_load_func()
+        db = load_snapshot(data_load_func).checkout()
+        start = time.perf_counter()
+        db.digest()
+        first = time.perf_counter() - start
+        # simulate an episode that wrote a handful of records
+        db[table][key]["status"] = "cancelled"
+        data[table][key]["status"] = "cancelled"
+        full = timeit(lambda: consistent_hash(to_hashable(data)), args.repeat)
+        incremental = timeit(db.digest, args.repeat)
+        print(
+            f"{env_name}: full hash {full * 1e3:.2f} ms | incremental {incremental * 1e3:.3f} ms "
+            f"({full / incremental:.0f}x) | one-time base digest {first * 1e3:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Copyright Sierra
+
+import argparse
+import json
+import os
+import time
+from typing import Any, Callable, Dict
+
+from tau_bench.envs.airline import data as airline_data
+from tau_bench.envs.data_snapshot import build_snapshot, load_json_tables, read_snapshot
+from tau_bench.envs.retail import data as retail_data
+
+
+def timeit(func: Callable[[], Any], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def plain_json_load(folder: str, tables: Dict[str, str]) -> Dict[str, Any]:
+    # the loader before compiled snapshots existed
+    data = {}
+    for name, filename in tables.items():
+        with open(os.path.join(folder, filename)) as f:
+            data[name] = json.load(f)
+    return data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare JSON and compiled snapshot loads")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    for env_name, module in [("retail", retail_data), ("airline", airline_data)]:
+        folder, tables = module.FOLDER_PATH, module.TABLES
+        if read_snapshot(folder, tables) is None:
+            build_snapshot(folder, tables)
+        assert read_snapshot(folder, tables) == plain_json_load(folder, tables)
+        plain = timeit(lambda: plain_json_load(folder, tables), args.repeat)
+        json_fallback = timeit(lambda: load_json_tables(folder, tables), args.repeat)
+        snapshot = timeit(lambda: read_snapshot(folder, tables), args.repeat)
+        print(
+            f"{env_name}: json.load {plain * 1e3:.1f} ms | json fallback {json_fallback * 1e3:.1f} ms "
+            f"| snapshot {snapshot * 1e3:.1f} ms ({plain / snapshot:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
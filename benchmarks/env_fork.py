@@ -0,0 +1,67 @@
+# Copyright Sierra
+
+import argparse
+import copy
+import time
+import tracemalloc
+from typing import Callable, List
+
+from tau_bench.envs import get_env
+from tau_bench.envs.base import Env
+from tau_bench.envs.db import to_hashable
+
+
+def measure(func: Callable[[], List[Env]]) -> str:
+    tracemalloc.start()
+    start = time.perf_counter()
+    branches = func()
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    n = len(branches)
+    return (
+        f"{elapsed * 1e3:9.1f} ms total {elapsed / n * 1e6:9.1f} us/branch "
+        f"{current / 2**20:8.1f} MB total {current / n / 2**10:8.1f} KB/branch"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Latency and memory of Env.fork()")
+    parser.add_argument("--env", type=str, choices=["retail", "airline"], default="retail")
+    parser.add_argument("--branches", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--naive-branches", type=int, default=10)
+    args = parser.parse_args()
+
+    env = get_env(
+        args.env,
+        user_strategy="llm",
+        user_model="gpt-4o",
+        user_provider="openai",
+        task_split="test",
+        task_index=0,
+    )
+    # a mid-episode state: the ground-truth writes of task 0 and a 20-turn conversation
+    env.task = env.tasks[0]
+    for action in env.task.actions:
+        env.step(action)
+    env.user.messages = [
+        {"role": "user" if i % 2 else "assistant", "content": "hello " * 50}
+        for i in range(20)
+    ]
+    to_hashable(env.data)  # warm up the base snapshot before measuring
+
+    for n in args.branches:
+        print(f"fork x{n:<5d} {measure(lambda: [env.fork() for _ in range(n)])}")
+
+    def naive_copy() -> Env:
+        child = copy.copy(env)
+        child.data = copy.deepcopy({name: dict(table.items()) for name, table in env.data.items()})
+        child.user = copy.deepcopy(env.user)
+        return child
+
+    n = args.naive_branches
+    print(f"deepcopy x{n:<3d} {measure(lambda: [naive_copy() for _ in range(n)])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Copyright Sierra
+
+import argparse
+import time
+
+from tau_bench.envs import get_env
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-task env setup cost: get_env() per task vs new_episode() from a shared env"
+    )
+    parser.add_argument("--env", type=str, choices=["retail", "airline"], default="retail")
+    parser.add_argument("--task-split", type=str, default="test")
+    parser.add_argument("--num-tasks", type=int, default=50)
+    args = parser.parse_args()
+
+    def build(task_index: int):
+        # the `llm` user strategy does not call the model until the episode is reset
+        return get_env(
+            args.env,
+            user_strategy="llm",
+            user_model="gpt-4o",
+            user_provider="openai",
+            task_split=args.task_split,
+            task_index=task_index,
+        )
+
+    start = time.perf_counter()
+    env = build(0)
+    print(f"first env (loads data and tasks): {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    num_tasks = min(args.num_tasks, len(env.tasks))
+    start = time.perf_counter()
+    for task_index in range(num_tasks):
+        build(task_index)
+    per_get_env = (time.perf_counter() - start) / num_tasks
+
+    start = time.perf_counter()
+    for task_index in range(num_tasks):
+        env.new_episode(task_index=task_index)
+    per_episode = (time.perf_counter() - start) / num_tasks
+
+    print(f"get_env per task: {per_get_env * 1e6:.1f} us")
+    print(f"new_episode per task: {per_episode * 1e6:.1f} us ({per_get_env / per_episode:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Copyright Sierra
+
+import argparse
+import random
+import time
+from typing import Any, Dict
+
+from tau_bench.envs.airline.data import load_data
+from tau_bench.envs.airline.tools.search_direct_flight import SearchDirectFlight
+from tau_bench.envs.airline.tools.search_onestop_flight import SearchOnestopFlight
+from tau_bench.envs.db import Snapshot, copy_json
+
+
+def scale_flights(data: Dict[str, Any], factor: int) -> Dict[str, Any]:
+    # replicas of the network between renamed airports (e.g. JFK7), so the table
+    # grows while searches between the original airports return the same results
+    flights = {}
+    for i in range(factor):
+        for flight_number, flight in data["flights"].items():
+            flight = copy_json(flight)
+            if i:
+                flight["flight_number"] = f"{flight_number}-{i}"
+                flight["origin"] += str(i)
+                flight["destination"] += str(i)
+            flights[flight["flight_number"]] = flight
+    return {**data, "flights": flights}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Flight searches on an indexed checkout vs a linear scan of the flights table"
+    )
+    parser.add_argument("--factors", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    base = load_data()
+    airports = sorted({flight["origin"] for flight in base["flights"].values()})
+    rng = random.Random(args.seed)
+    queries = [
+        (*rng.sample(airports, 2), f"2024-05-{rng.randint(1, 30):02d}")
+        for _ in range(args.queries)
+    ]
+    for factor in args.factors:
+        data = scale_flights(base, factor)
+        snapshot = Snapshot(data)
+        db = snapshot.checkout()
+        # the episode wrote to a few flights, so lookups go through the overlay correction
+        for flight_number in rng.sample(list(base["flights"]), 10):
+            db["flights"][flight_number]["dates"].setdefault("2024-05-20", {})["status"] = "available"
+        plain = {name: dict(table.items()) for name, table in db.items()}
+        start = time.perf_counter()
+        for tool in [SearchDirectFlight, SearchOnestopFlight]:
+            tool.invoke(db, *queries[0])  # build the indexes
+        build = time.perf_counter() - start
+        for tool in [SearchDirectFlight, SearchOnestopFlight]:
+            timings = {}
+            for name, tables in [("indexed", db), ("scan", plain)]:
+                start = time.perf_counter()
+                results = [tool.invoke(tables, *query) for query in queries]
+                timings[name] = (time.perf_counter() - start) / len(queries)
+                timings[f"{name}_results"] = results
+            assert timings["indexed_results"] == timings["scan_results"]
+            print(
+                f"{len(data['flights']):6d} flights {tool.__name__:20s} "
+                f"scan {timings['scan'] * 1e3:9.2f} ms | indexed {timings['indexed'] * 1e3:7.3f} ms "
+                f"({timings['scan'] / timings['indexed']:.0f}x)"
+            )
+        print(f"{len(data['flights']):6d} flights one-time index build {build * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
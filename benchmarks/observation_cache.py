@@ -0,0 +1,82 @@
+# Copyright Sierra
+
+import argparse
+import time
+
+from tau_bench.envs.airline.data import load_data as load_airline_data
+from tau_bench.envs.airline.tools.get_reservation_details import GetReservationDetails
+from tau_bench.envs.airline.tools.update_reservation_baggages import UpdateReservationBaggages
+from tau_bench.envs.db import load_snapshot
+from tau_bench.envs.retail.data import load_data as load_retail_data
+from tau_bench.envs.retail.tools.get_product_details import GetProductDetails
+from tau_bench.envs.retail.tools.get_user_details import GetUserDetails
+from tau_bench.envs.retail.tools.modify_user_address import ModifyUserAddress
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Repeated read-only tool calls with and without the observation cache, with a write to each record halfway through"
+    )
+    parser.add_argument("--reads", type=int, default=20, help="reads of each record per episode")
+    parser.add_argument("--records", type=int, default=50)
+    args = parser.parse_args()
+
+    cases = [
+        # (name, data_load_func, read tool, read kwarg, table, write between reads)
+        (
+            "retail GetProductDetails",
+            load_retail_data,
+            GetProductDetails,
+            "product_id",
+            "products",
+            None,
+        ),
+        (
+            "retail GetUserDetails",
+            load_retail_data,
+            GetUserDetails,
+            "user_id",
+            "users",
+            lambda db, key: ModifyUserAddress.invoke(
+                db, user_id=key, **{**db["users"].peek(key)["address"], "zip": "00000"}
+            ),
+        ),
+        (
+            "airline GetReservationDetails",
+            load_airline_data,
+            GetReservationDetails,
+            "reservation_id",
+            "reservations",
+            lambda db, key: UpdateReservationBaggages.invoke(
+                db, reservation_id=key, total_baggages=0, nonfree_baggages=0, payment_id="none"
+            ),
+        ),
+    ]
+    for name, data_load_func, tool, kwarg, table, write in cases:
+        snapshot = load_snapshot(data_load_func)
+        keys = list(snapshot.tables[table])[: args.records]
+        timings = {}
+        for cached in [False, True]:
+            db = snapshot.checkout()
+            elapsed = 0.0
+            for key in keys:
+                for i in range(args.reads):
+                    if write is not None and i == args.reads // 2:
+                        write(db, key)
+                    start = time.perf_counter()
+                    if cached:
+                        tool.invoke(db, **{kwarg: key})
+                    else:
+                        # what the tools did before: serialize the record on every call
+                        tool.invoke({table: {key: db[table].peek(key)}}, **{kwarg: key})
+                    elapsed += time.perf_counter() - start
+            timings[cached] = elapsed / (len(keys) * args.reads)
+        stats = db.observation_stats
+        print(
+            f"{name:30s} uncached {timings[False] * 1e6:7.1f} us | cached {timings[True] * 1e6:6.1f} us "
+            f"({timings[False] / timings[True]:.1f}x) | hits {stats['hits']} misses {stats['misses']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Copyright Sierra
+
+import argparse
+from typing import Dict, Tuple
+
+from tau_bench.envs import get_env
+from tau_bench.types import ToolProfile
+
+ENCODINGS = [
+    (),
+    ("compact",),
+    ("compact", "omit-empty"),
+    ("compact", "omit-empty", "sort-keys"),
+]
+
+
+def replay(env_name: str, task_split: str, encoding: Tuple[str, ...]) -> Dict[str, ToolProfile]:
+    env = get_env(
+        env_name,
+        user_strategy="human",
+        user_model="gpt-4o",
+        task_split=task_split,
+        task_index=0,
+        observation_encoding=encoding,
+    )
+    env.profile_tools = True
+    totals: Dict[str, ToolProfile] = {}
+    for task_index, task in enumerate(env.tasks):
+        episode = env.new_episode(task_index=task_index)
+        for action in task.actions:
+            if action.name not in episode.terminate_tools:
+                episode.step(action)
+        for name, profile in episode.tool_profile.items():
+            total = totals.setdefault(name, ToolProfile())
+            total.calls += profile.calls
+            total.tokens += profile.tokens
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Approximate observation tokens per tool for each observation encoding, over the ground-truth actions of a split"
+    )
+    parser.add_argument("--env", type=str, choices=["retail", "airline"], default="retail")
+    parser.add_argument("--task-split", type=str, default="test")
+    args = parser.parse_args()
+
+    profiles = [replay(args.env, args.task_split, encoding) for encoding in ENCODINGS]
+    names = ["default"] + ["+".join(encoding) for encoding in ENCODINGS[1:]]
+    print(f"{'tool':32s} {'calls':>6s} " + " ".join(f"{name:>28s}" for name in names))
+    rows = sorted(profiles[0], key=lambda name: -profiles[0][name].tokens)
+    for name in rows + ["total"]:
+        if name == "total":
+            tokens = [sum(p.tokens for p in profile.values()) for profile in profiles]
+            calls = sum(p.calls for p in profiles[0].values())
+        else:
+            tokens = [profile[name].tokens for profile in profiles]
+            calls = profiles[0][name].calls
+        cells = [f"{tokens[0]:28d}"] + [
+            f"{t:>19d} ({1 - t / tokens[0] if tokens[0] else 0:6.1%})" for t in tokens[1:]
+        ]
+        print(f"{name:32s} {calls:6d} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
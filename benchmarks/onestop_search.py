@@ -0,0 +1,51 @@
+# Copyright Sierra
+
+import argparse
+import itertools
+import time
+
+from tau_bench.envs.airline.data import load_data
+from tau_bench.envs.airline.tools.search_onestop_flight import SearchOnestopFlight
+from tau_bench.envs.db import Snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Every origin x destination x date one-stop search: scan vs per-date connection tables"
+    )
+    parser.add_argument("--skip-scan", action="store_true", help="skip the slow linear scan baseline")
+    args = parser.parse_args()
+
+    data = load_data()
+    flights = data["flights"]
+    airports = sorted({flight["origin"] for flight in flights.values()})
+    dates = sorted({date for flight in flights.values() for date in flight["dates"]})
+    queries = list(itertools.product(airports, airports, dates))
+    print(f"{len(airports)} airports x {len(airports)} x {len(dates)} dates = {len(queries)} queries")
+
+    def run(tables) -> list:
+        start = time.perf_counter()
+        results = [SearchOnestopFlight.invoke(tables, *query) for query in queries]
+        elapsed = time.perf_counter() - start
+        return [elapsed, results]
+
+    db = Snapshot(data).checkout()
+    timings = {}
+    timings["connection tables, cold"], cold = run(db)
+    timings["connection tables, warm"], warm = run(db)
+    # an episode that touched one flight from every airport recomputes those searches live
+    touched = db.snapshot.checkout()
+    for airport in airports:
+        flight_number = next(n for n, f in flights.items() if f["origin"] == airport)
+        touched["flights"][flight_number]
+    timings["route indexes (touched flights)"], live = run(touched)
+    assert cold == warm == live
+    if not args.skip_scan:
+        timings["linear scan"], scan = run(data)
+        assert scan == warm
+    for name, elapsed in timings.items():
+        print(f"{name:32s} {elapsed:7.2f} s total {elapsed / len(queries) * 1e6:9.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+# Copyright Sierra
+
+import argparse
+import time
+
+from tau_bench.envs import get_env
+from tau_bench.envs.db import consistent_hash, to_hashable
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-task reward cost: full hash vs incremental digest vs structural diff of touched records"
+    )
+    parser.add_argument("--env", type=str, choices=["retail", "airline"], default="retail")
+    parser.add_argument("--task-split", type=str, default="test")
+    parser.add_argument("--num-tasks", type=int, default=50)
+    args = parser.parse_args()
+
+    env = get_env(
+        args.env,
+        user_strategy="human",
+        user_model="gpt-4o",
+        task_split=args.task_split,
+        task_index=0,
+    )
+    # measure the ground-truth replay in every mode rather than the on-disk cache
+    env.gt_hash_cache = None
+    env.get_data_hash()  # warm up the base digests
+    num_tasks = min(args.num_tasks, len(env.tasks))
+
+    def run(reward_mode: str, full_hash: bool = False) -> float:
+        elapsed = 0.0
+        for task_index in range(num_tasks):
+            episode = env.new_episode(task_index=task_index)
+            episode.reward_mode = reward_mode
+            if full_hash:
+                episode.get_data_hash = lambda: consistent_hash(to_hashable(episode.data))
+            # a perfect agent's writes, so both sides touched the same records
+            for action in episode.task.actions:
+                if action.name not in episode.terminate_tools:
+                    episode.step(action)
+            start = time.perf_counter()
+            episode.calculate_reward()
+            elapsed += time.perf_counter() - start
+        return elapsed / num_tasks
+
+    full = run("hash", full_hash=True)
+    incremental = run("hash")
+    diff = run("diff")
+    print(f"{args.env}: full hash {full * 1e3:.2f} ms/task")
+    print(f"{args.env}: incremental digest {incremental * 1e3:.2f} ms/task ({full / incremental:.0f}x)")
+    print(f"{args.env}: structural diff {diff * 1e3:.2f} ms/task ({full / diff:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
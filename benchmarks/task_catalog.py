@@ -0,0 +1,56 @@
+# Copyright Sierra
+
+import argparse
+import subprocess
+import sys
+
+SPLITS = {
+    "retail/train": ("tau_bench.envs.retail.tasks_train", "TASKS_TRAIN"),
+    "retail/test": ("tau_bench.envs.retail.tasks_test", "TASKS_TEST"),
+    "retail/dev": ("tau_bench.envs.retail.tasks_dev", "TASKS_DEV"),
+    "airline/test": ("tau_bench.envs.airline.tasks_test", "TASKS"),
+}
+
+# run in a fresh interpreter so that import time and peak RSS are not shared between splits
+PROBE = """
+import importlib, resource, sys, time
+import tau_bench.types, tau_bench.envs.task_catalog
+module_name, attr, mode = sys.argv[1:4]
+importlib.import_module(module_name.rsplit(".", 1)[0])
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+tasks = getattr(importlib.import_module(module_name), attr)
+if mode == "one":
+    tasks[len(tasks) // 2]
+elif mode == "all":
+    tasks = list(tasks)
+elapsed = time.perf_counter() - start
+print(len(tasks), elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss)
+"""
+
+
+def probe(module_name: str, attr: str, mode: str) -> str:
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, module_name, attr, mode],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    num_tasks, elapsed, rss_kb = int(out[0]), float(out[1]), int(out[2])
+    return f"{elapsed * 1e3:7.1f} ms {rss_kb / 1024:6.1f} MB ({num_tasks} tasks)"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Import time and peak RSS of the lazy task catalogs"
+    )
+    parser.parse_args()
+    for split, (module_name, attr) in SPLITS.items():
+        print(split)
+        # `all` materializes every task, which is what importing the split used to do
+        for mode, label in [("none", "open catalog"), ("one", "open + 1 task"), ("all", "all tasks")]:
+            print(f"  {label:14s} {probe(module_name, attr, mode)}")
+
+
+if __name__ == "__main__":
+    main()
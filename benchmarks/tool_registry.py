@@ -0,0 +1,45 @@
+# Copyright Sierra
+
+import argparse
+import time
+
+from tau_bench.envs.base import Env
+from tau_bench.envs.retail.data import load_data
+from tau_bench.envs.retail.rules import RULES
+from tau_bench.envs.retail.tasks_test import TASKS_TEST
+from tau_bench.envs.retail.tools import ALL_TOOLS
+from tau_bench.envs.retail.wiki import WIKI
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Env construction from a list of tool classes vs the shared ToolRegistry"
+    )
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    def build(tools) -> Env:
+        return Env(
+            data_load_func=load_data,
+            tools=tools,
+            tasks=TASKS_TEST,
+            wiki=WIKI,
+            rules=RULES,
+            user_strategy="human",
+            user_model="gpt-4o",
+            task_index=0,
+        )
+
+    build(ALL_TOOLS)  # load the data snapshot
+    timings = {}
+    for name, tools in [("list of tools", list(ALL_TOOLS)), ("ToolRegistry", ALL_TOOLS)]:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            build(tools)
+        timings[name] = (time.perf_counter() - start) / args.repeat
+        print(f"{name:14s} {timings[name] * 1e6:8.1f} us per Env")
+    print(f"speedup {timings['list of tools'] / timings['ToolRegistry']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
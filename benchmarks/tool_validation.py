@@ -0,0 +1,55 @@
+# Copyright Sierra
+
+import argparse
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from tau_bench.envs import get_env
+from tau_bench.types import Action
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-tool cost of argument validation vs the tool call, over the ground-truth actions"
+    )
+    parser.add_argument("--env", type=str, choices=["retail", "airline"], default="retail")
+    parser.add_argument("--task-split", type=str, default="test")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    env = get_env(
+        args.env,
+        user_strategy="human",
+        user_model="gpt-4o",
+        task_split=args.task_split,
+        task_index=0,
+    )
+    actions: Dict[str, List[Action]] = defaultdict(list)
+    for task in env.tasks:
+        for action in task.actions:
+            if action.name in env.tools_map:
+                actions[action.name].append(action)
+
+    print(f"{'tool':34s} {'calls':>6s} {'validate':>12s} {'invoke':>12s} {'overhead':>9s}")
+    for name, tool_actions in sorted(actions.items()):
+        validate = env.tool_validators[name]
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for action in tool_actions:
+                validate(action.kwargs)
+        validation = (time.perf_counter() - start) / (args.repeat * len(tool_actions))
+        # on a fresh checkout per call, as the first call of an episode would see it
+        episodes = [env.new_episode() for _ in tool_actions]
+        start = time.perf_counter()
+        for episode, action in zip(episodes, tool_actions):
+            episode.invoke_tool(action)
+        invocation = (time.perf_counter() - start) / len(tool_actions)
+        print(
+            f"{name:34s} {len(tool_actions):6d} {validation * 1e6:9.2f} us {invocation * 1e6:9.2f} us "
+            f"{validation / invocation:8.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# Copyright Sierra
+
+import argparse
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from tau_bench.run import get_work_items
+from tau_bench.types import RunConfig
+
+
+def sample_durations(
+    num_tasks: int, num_trials: int, median: float, sigma: float, seed: int
+) -> Dict[Tuple[int, int], float]:
+    """Log-normal episode durations: some tasks are much slower than others in every trial."""
+    rng = random.Random(seed)
+    task_scale = [rng.lognormvariate(0, sigma) for _ in range(num_tasks)]
+    return {
+        (task_id, trial): median * task_scale[task_id] * rng.lognormvariate(0, sigma / 2)
+        for task_id in range(num_tasks)
+        for trial in range(num_trials)
+    }
+
+
+def run_per_trial(
+    work: List[Tuple[int, int]], durations: Dict[Tuple[int, int], float], concurrency: int
+) -> float:
+    start = time.perf_counter()
+    for trial in sorted({trial for _, trial in work}):
+        items = [item for item in work if item[1] == trial]
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(lambda item: time.sleep(durations[item]), items))
+    return time.perf_counter() - start
+
+
+def run_single_queue(
+    work: List[Tuple[int, int]], durations: Dict[Tuple[int, int], float], concurrency: int
+) -> float:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lambda item: time.sleep(durations[item]), work))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Simulated wall-clock time of a multi-trial run: an executor per trial vs one work queue"
+    )
+    parser.add_argument("--num-tasks", type=int, default=50)
+    parser.add_argument("--num-trials", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--median", type=float, default=0.02, help="Median episode duration in seconds")
+    parser.add_argument("--sigma", type=float, default=1.0, help="Log-normal skew of episode durations")
+    parser.add_argument("--seed", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"tasks={args.num_tasks} concurrency={args.concurrency} median={args.median * 1e3:.0f}ms sigma={args.sigma}")
+    print(f"{'trials':>6s} {'lower bound':>12s} {'per trial':>10s} {'one queue':>10s} {'speedup':>8s}")
+    for num_trials in args.num_trials:
+        config = RunConfig(
+            model_provider="openai",
+            user_model_provider="openai",
+            model="gpt-4o",
+            num_trials=num_trials,
+            shuffle=1,
+            seed=args.seed,
+        )
+        random.seed(config.seed)
+        work = get_work_items(config, args.num_tasks)
+        durations = sample_durations(args.num_tasks, num_trials, args.median, args.sigma, args.seed)
+        lower_bound = max(sum(durations.values()) / args.concurrency, max(durations.values()))
+        per_trial = run_per_trial(work, durations, args.concurrency)
+        single_queue = run_single_queue(work, durations, args.concurrency)
+        print(
+            f"{num_trials:6d} {lower_bound:11.2f}s {per_trial:9.2f}s {single_queue:9.2f}s "
+            f"{per_trial / single_queue:7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Copyright Sierra
+
+import argparse
+import random
+import time
+from typing import Any, Dict
+
+from tau_bench.envs.db import Snapshot, copy_json
+from tau_bench.envs.retail.data import load_data
+from tau_bench.envs.retail.tools.find_user_id_by_email import FindUserIdByEmail
+from tau_bench.envs.retail.tools.find_user_id_by_name_zip import FindUserIdByNameZip
+from tau_bench.envs.retail.tools.modify_user_address import ModifyUserAddress
+
+
+def scale_users(data: Dict[str, Any], factor: int) -> Dict[str, Any]:
+    # replicas of every user with distinct ids, emails and last names
+    users = {}
+    for i in range(factor):
+        for user_id, user in data["users"].items():
+            user = copy_json(user)
+            if i:
+                user_id = f"{user_id}_{i}"
+                user["email"] = f"{i}.{user['email']}"
+                user["name"]["last_name"] += str(i)
+            users[user_id] = user
+    return {**data, "users": users}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Retail user lookups on an indexed checkout vs a linear scan of the users table"
+    )
+    parser.add_argument("--factors", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    base = load_data()
+    rng = random.Random(args.seed)
+    for factor in args.factors:
+        data = scale_users(base, factor)
+        db = Snapshot(data).checkout()
+        user_ids = rng.sample(list(data["users"]), args.queries)
+        # move a few users, so lookups go through the overlay correction
+        for user_id in user_ids[:10]:
+            address = {**data["users"][user_id]["address"], "zip": f"{rng.randint(0, 99999):05d}"}
+            ModifyUserAddress.invoke(db, user_id=user_id, **address)
+        users = [db["users"].peek(user_id) for user_id in user_ids]
+        queries = [
+            (FindUserIdByEmail, [{"email": user["email"].upper()} for user in users]),
+            (
+                FindUserIdByNameZip,
+                [
+                    {
+                        "first_name": user["name"]["first_name"],
+                        "last_name": user["name"]["last_name"].lower(),
+                        "zip": user["address"]["zip"],
+                    }
+                    for user in users
+                ],
+            ),
+        ]
+        plain = {name: dict(table.items()) for name, table in db.items()}
+        start = time.perf_counter()
+        for tool, kwargs in queries:
+            tool.invoke(db, **kwargs[0])  # build the indexes
+        build = time.perf_counter() - start
+        for tool, kwargs in queries:
+            timings, results = {}, {}
+            for name, tables in [("indexed", db), ("scan", plain)]:
+                start = time.perf_counter()
+                results[name] = [tool.invoke(tables, **query) for query in kwargs]
+                timings[name] = (time.perf_counter() - start) / len(kwargs)
+            assert results["indexed"] == results["scan"] == user_ids
+            print(
+                f"{len(data['users']):6d} users {tool.__name__:20s} "
+                f"scan {timings['scan'] * 1e3:8.3f} ms | indexed {timings['indexed'] * 1e3:6.3f} ms "
+                f"({timings['scan'] / timings['indexed']:.0f}x)"
+            )
+        print(f"{len(data['users']):6d} users one-time index build {build * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# Copyright Sierra
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from tau_bench.envs import get_env
+from tau_bench.envs.base import Env
+from tau_bench.envs.user import BaseUserSimulationEnv
+from tau_bench.envs.vector_env import VectorEnv
+from tau_bench.types import Action
+
+
+class ScriptedUser(BaseUserSimulationEnv):
+    def reset(self, instruction: Optional[str] = None) -> str:
+        return "Hi, I need help with my order."
+
+    def step(self, content: str) -> str:
+        return "###STOP###"
+
+    def get_total_cost(self) -> float:
+        return 0.0
+
+
+def run_threads(env: Env, task_indices: List[int]) -> float:
+    def run(task_index: int) -> float:
+        episode = env.new_episode(task_index=task_index)
+        episode.user = ScriptedUser()
+        episode.reset(task_index=task_index)
+        reward = 0.0
+        for action in episode.task.actions:
+            reward = episode.step(action).reward
+        return reward
+
+    with ThreadPoolExecutor(max_workers=len(task_indices)) as executor:
+        return sum(executor.map(run, task_indices))
+
+
+def run_vector(env: Env, task_indices: List[int]) -> float:
+    venv = VectorEnv(env, num_envs=len(task_indices))
+    for episode in venv.envs:
+        episode.user = ScriptedUser()
+    venv.reset(task_indices)
+    rewards = [0.0] * venv.num_envs
+    for t in range(max(len(episode.task.actions) for episode in venv.envs)):
+        actions: List[Optional[Action]] = [
+            episode.task.actions[t] if t < len(episode.task.actions) else None
+            for episode in venv.envs
+        ]
+        for i, response in enumerate(venv.step(actions)):
+            if response is not None:
+                rewards[i] = response.reward
+    venv.close()
+    return sum(rewards)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Replay ground-truth actions for N episodes: a thread per episode vs one VectorEnv loop"
+    )
+    parser.add_argument("--env", type=str, choices=["retail", "airline"], default="retail")
+    parser.add_argument("--task-split", type=str, default="test")
+    parser.add_argument("--num-envs", type=int, nargs="+", default=[10, 100, 500])
+    args = parser.parse_args()
+
+    env = get_env(
+        args.env,
+        user_strategy="llm",
+        user_model="gpt-4o",
+        user_provider="openai",
+        task_split=args.task_split,
+        task_index=0,
+    )
+    # warm up the base digests and the ground-truth hash cache
+    run_vector(env, list(range(len(env.tasks))))
+
+    for n in args.num_envs:
+        task_indices = [i % len(env.tasks) for i in range(n)]
+        for name, func in [("threads", run_threads), ("vector", run_vector)]:
+            start = time.perf_counter()
+            total = func(env, task_indices)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{name:8s} n={n:<5d} {elapsed * 1e3:9.1f} ms "
+                f"{elapsed / n * 1e6:8.1f} us/episode  reward {total / n:.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
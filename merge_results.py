@@ -0,0 +1,30 @@
+# Copyright Sierra
+
+import argparse
+
+from tau_bench.checkpoint import merge_results, write_results
+from tau_bench.run import display_metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Combine the checkpoints or results files of the shards of a run and display the metrics of the union"
+    )
+    parser.add_argument("paths", type=str, nargs="+", help="Checkpoints (.jsonl, .jsonl.gz) or results files (.json)")
+    parser.add_argument("--output", type=str, help="(Optional) path of the combined JSON results file to write")
+    args = parser.parse_args()
+
+    results = merge_results(args.paths)
+    if len(results) == 0:
+        raise ValueError("No results found")
+    num_tasks = len(set(result.task_id for result in results))
+    num_trials = len(set(result.trial for result in results))
+    print(f"Merged {len(results)} results ({num_tasks} tasks, {num_trials} trials) from {len(args.paths)} files")
+    display_metrics(results)
+    if args.output is not None:
+        write_results(args.output, results)
+        print(f"\n📄 Results saved to {args.output}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,11 @@
 
 import argparse
 from tau_bench.types import RunConfig
-from tau_bench.run import run
+from tau_bench.run import RUNNERS, run
 from litellm import provider_list
 from tau_bench.envs.user import UserStrategy
+from tau_bench.envs.base import REWARD_MODES
+from tau_bench.envs.observation import OBSERVATION_ENCODING_OPTIONS
 
 
 def parse_args() -> RunConfig:
@@ -69,6 +71,63 @@ def parse_args() -> RunConfig:
     parser.add_argument("--shuffle", type=int, default=0)
     parser.add_argument("--user-strategy", type=str, default="llm", choices=[item.value for item in UserStrategy])
     parser.add_argument("--few-shot-displays-path", type=str, help="Path to a jsonlines file containing few shot displays")
+    parser.add_argument(
+        "--reward-mode",
+        type=str,
+        default="hash",
+        choices=REWARD_MODES,
+        help="Compare the final database with the ground truth by hash, or by a structural diff of the touched records that is reported in the reward info",
+    )
+    parser.add_argument(
+        "--profile-tools",
+        action="store_true",
+        help="Record the time, observation bytes and approximate tokens of every tool call, reported per task and summarized at the end",
+    )
+    parser.add_argument(
+        "--max-tool-workers",
+        type=int,
+        default=1,
+        help="Number of threads running the read-only tool calls of one agent turn; only pays off for tools that wait on I/O",
+    )
+    parser.add_argument(
+        "--observation-encoding",
+        type=str,
+        nargs="+",
+        default=[],
+        choices=OBSERVATION_ENCODING_OPTIONS,
+        help="Re-encode the JSON observations of tools to save prompt tokens: compact separators, omit null and empty fields, and/or sort keys",
+    )
+    parser.add_argument(
+        "--runner",
+        type=str,
+        default="thread",
+        choices=RUNNERS,
+        help="Run each episode in its own thread, or drive up to --max-concurrency episodes from one asyncio event loop with async LLM calls",
+    )
+    parser.add_argument(
+        "--compress-checkpoint",
+        action="store_true",
+        help="Gzip the JSON Lines checkpoint that results are appended to as tasks finish",
+    )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        metavar="CHECKPOINT",
+        help="Continue an interrupted run from its .jsonl(.gz) checkpoint: tasks that completed are skipped and new results are appended to it. Pass the same run options as the original run",
+    )
+    parser.add_argument(
+        "--num-shards",
+        type=int,
+        default=1,
+        help="Split the (task, trial) pairs of the run into this many shards, e.g. one per machine, and run only the shard given by --shard-index. Combine the shard results with merge_results.py",
+    )
+    parser.add_argument("--shard-index", type=int, default=0)
+    parser.add_argument(
+        "--num-processes",
+        type=int,
+        default=1,
+        help="Run the tasks in this many local worker processes, sharing --max-concurrency between them",
+    )
     args = parser.parse_args()
     print(args)
     return RunConfig(
@@ -90,6 +149,16 @@ def parse_args() -> RunConfig:
         shuffle=args.shuffle,
         user_strategy=args.user_strategy,
         few_shot_displays_path=args.few_shot_displays_path,
+        reward_mode=args.reward_mode,
+        profile_tools=args.profile_tools,
+        max_tool_workers=args.max_tool_workers,
+        observation_encoding=args.observation_encoding,
+        runner=args.runner,
+        compress_checkpoint=args.compress_checkpoint,
+        resume_from=args.resume,
+        num_shards=args.num_shards,
+        shard_index=args.shard_index,
+        num_processes=args.num_processes,
     )
 
 
@@ -1,9 +1,17 @@
 # Copyright Sierra
 
 import abc
-from typing import Optional
+import asyncio
+import json
+from typing import Any, Dict, List, Optional
 from tau_bench.envs.base import Env
-from tau_bench.types import SolveResult
+from tau_bench.types import (
+    Action,
+    EnvResetResponse,
+    EnvResponse,
+    RESPOND_ACTION_NAME,
+    SolveResult,
+)
 
 
 class Agent(abc.ABC):
@@ -12,3 +20,101 @@ class Agent(abc.ABC):
         self, env: Env, task_index: Optional[int] = None, max_num_steps: int = 30
     ) -> SolveResult:
         raise NotImplementedError
+
+    async def asolve(
+        self, env: Env, task_index: Optional[int] = None, max_num_steps: int = 30
+    ) -> SolveResult:
+        # agents without a native async implementation block a worker thread instead
+        return await asyncio.to_thread(self.solve, env, task_index, max_num_steps)
+
+
+class Trajectory(object):
+    """The messages, info, reward and LLM cost an agent accumulates over an episode.
+
+    Holds everything `solve` and `asolve` share, so that the two only differ in
+    how they call the LLM and step the env.
+    """
+
+    def __init__(self, system_prompt: str, reset_response: EnvResetResponse) -> None:
+        self.messages: List[Dict[str, Any]] = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": reset_response.observation},
+        ]
+        self.info: Dict[str, Any] = reset_response.info.model_dump()
+        self.reward = 0.0
+        self.total_cost = 0.0
+
+    def read_response(self, res: Any) -> Dict[str, Any]:
+        """The message of an LLM response; adds the cost of the response."""
+        self.total_cost += res._hidden_params["response_cost"] or 0
+        return res.choices[0].message.model_dump()
+
+    def record(
+        self, messages: List[Dict[str, Any]], env_responses: List[EnvResponse]
+    ) -> bool:
+        """Appends the messages of a turn and the env responses to it; returns whether the episode is done."""
+        self.messages.extend(messages)
+        for env_response in env_responses:
+            self.info = {**self.info, **env_response.info.model_dump()}
+        self.reward = env_responses[-1].reward
+        return env_responses[-1].done
+
+    def record_turn(
+        self, message: Dict[str, Any], env_responses: List[EnvResponse]
+    ) -> bool:
+        """Records a tool-calling turn, see `turn_messages`; returns whether the episode is done."""
+        return self.record(turn_messages(message, env_responses), env_responses)
+
+    def result(self) -> SolveResult:
+        return SolveResult(
+            reward=self.reward,
+            info=self.info,
+            messages=self.messages,
+            total_cost=self.total_cost,
+        )
+
+
+def valid_tool_calls(message: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        tool_call
+        for tool_call in message.get("tool_calls") or []
+        if tool_call["function"] is not None
+    ]
+
+
+def message_to_actions(
+    message: Dict[str, Any],
+) -> List[Action]:
+    tool_calls = valid_tool_calls(message)
+    if len(tool_calls) > 0:
+        return [
+            Action(
+                name=tool_call["function"]["name"],
+                kwargs=json.loads(tool_call["function"]["arguments"]),
+            )
+            for tool_call in tool_calls
+        ]
+    return [Action(name=RESPOND_ACTION_NAME, kwargs={"content": message["content"]})]
+
+
+def turn_messages(
+    message: Dict[str, Any], env_responses: List[EnvResponse]
+) -> List[Dict[str, Any]]:
+    """The assistant `message` followed by the env's answers to its actions.
+
+    Each tool call that was run is answered by a tool message, and the calls of
+    `message` are trimmed to those; a response is answered by the user's reply.
+    """
+    tool_calls = valid_tool_calls(message)
+    if len(tool_calls) == 0:
+        return [message, {"role": "user", "content": env_responses[0].observation}]
+    message["tool_calls"] = tool_calls[: len(env_responses)]
+    return [message] + [
+        {
+            "role": "tool",
+            "tool_call_id": tool_call["id"],
+            "name": tool_call["function"]["name"],
+            "content": env_response.observation,
+        }
+        for tool_call, env_response in zip(message["tool_calls"], env_responses)
+    ]
@@ -1,12 +1,13 @@
 # Copyright Sierra
 
 import json
-from litellm import completion
+from litellm import acompletion, completion
 
-from tau_bench.agents.base import Agent
+from tau_bench.agents.base import Agent, Trajectory
 from tau_bench.envs.base import Env
 from tau_bench.types import (
     Action,
+    EnvResponse,
     SolveResult,
     RESPOND_ACTION_NAME,
     RESPOND_ACTION_FIELD_NAME,
@@ -43,54 +44,68 @@ class ChatReActAgent(Agent):
             messages=messages,
             temperature=self.temperature,
         )
-        message = res.choices[0].message
-        action_str = message.content.split("Action:")[-1].strip()
-        try:
-            action_parsed = json.loads(action_str)
-        except json.JSONDecodeError:
-            # this is a hack
-            action_parsed = {
-                "name": RESPOND_ACTION_NAME,
-                "arguments": {RESPOND_ACTION_FIELD_NAME: action_str},
-            }
-        assert "name" in action_parsed
-        assert "arguments" in action_parsed
-        action = Action(name=action_parsed["name"], kwargs=action_parsed["arguments"])
-        return message.model_dump(), action, res._hidden_params["response_cost"]
+        return parse_next_step(res)
+
+    async def agenerate_next_step(
+        self, messages: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, Any], Action, float]:
+        res = await acompletion(
+            model=self.model,
+            custom_llm_provider=self.provider,
+            messages=messages,
+            temperature=self.temperature,
+        )
+        return parse_next_step(res)
 
     def solve(
         self, env: Env, task_index: Optional[int] = None, max_num_steps: int = 30
     ) -> SolveResult:
-        response = env.reset(task_index=task_index)
-        reward = 0.0
-        messages: List[Dict[str, Any]] = [
-            {"role": "system", "content": self.prompt},
-            {"role": "user", "content": response.observation},
-        ]
-        total_cost = 0.0
-        info = {}
+        traj = Trajectory(self.prompt, env.reset(task_index=task_index))
         for _ in range(max_num_steps):
-            message, action, cost = self.generate_next_step(messages)
+            message, action, cost = self.generate_next_step(traj.messages)
             response = env.step(action)
-            obs = response.observation
-            reward = response.reward
-            info = {**info, **response.info.model_dump()}
-            if action.name != RESPOND_ACTION_NAME:
-                obs = "API output: " + obs
-            messages.extend(
-                [
-                    message,
-                    {"role": "user", "content": obs},
-                ]
-            )
-            total_cost += cost
-            if response.done:
+            traj.total_cost += cost
+            if traj.record(step_messages(message, action, response), [response]):
                 break
-        return SolveResult(
-            messages=messages,
-            reward=reward,
-            info=info,
-        )
+        return traj.result()
+
+    async def asolve(
+        self, env: Env, task_index: Optional[int] = None, max_num_steps: int = 30
+    ) -> SolveResult:
+        traj = Trajectory(self.prompt, await env.areset(task_index=task_index))
+        for _ in range(max_num_steps):
+            message, action, cost = await self.agenerate_next_step(traj.messages)
+            response = await env.astep(action)
+            traj.total_cost += cost
+            if traj.record(step_messages(message, action, response), [response]):
+                break
+        return traj.result()
+
+
+def parse_next_step(res: Any) -> Tuple[Dict[str, Any], Action, float]:
+    message = res.choices[0].message
+    action_str = message.content.split("Action:")[-1].strip()
+    try:
+        action_parsed = json.loads(action_str)
+    except json.JSONDecodeError:
+        # this is a hack
+        action_parsed = {
+            "name": RESPOND_ACTION_NAME,
+            "arguments": {RESPOND_ACTION_FIELD_NAME: action_str},
+        }
+    assert "name" in action_parsed
+    assert "arguments" in action_parsed
+    action = Action(name=action_parsed["name"], kwargs=action_parsed["arguments"])
+    return message.model_dump(), action, res._hidden_params["response_cost"]
+
+
+def step_messages(
+    message: Dict[str, Any], action: Action, response: EnvResponse
+) -> List[Dict[str, Any]]:
+    obs = response.observation
+    if action.name != RESPOND_ACTION_NAME:
+        obs = "API output: " + obs
+    return [message, {"role": "user", "content": obs}]
 
 
 REACT_INSTRUCTION = f"""
@@ -0,0 +1,206 @@
+# Copyright Sierra
+
+import argparse
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+from typing import IO, Dict, List, Optional, Tuple
+
+from tau_bench.types import EnvRunResult
+
+
+CHECKPOINT_SUFFIXES = (".jsonl", ".jsonl.gz")
+
+
+def check_checkpoint_path(path: str) -> None:
+    """Raises a `ValueError` unless `path` names a JSON Lines checkpoint, the only files results are appended to."""
+    if not path.endswith(CHECKPOINT_SUFFIXES):
+        raise ValueError(f"Not a .jsonl or .jsonl.gz checkpoint: {path}")
+
+
+def open_checkpoint(path: str, mode: str) -> IO[str]:
+    """Opens a JSON Lines checkpoint in text mode, gzip-compressed if `path` ends in `.gz`."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class CheckpointWriter(object):
+    """Appends run results to a JSON Lines checkpoint, one result per line.
+
+    Lines are written by a single background thread, so workers only pay for
+    serializing their result. The file is flushed and fsynced at most once per
+    `fsync_interval` seconds and whenever the queue runs dry, which batches the
+    fsyncs of results finishing close together. Use as a context manager, or
+    call `close` to write out the remaining results.
+    """
+
+    def __init__(self, path: str, fsync_interval: float = 1.0) -> None:
+        check_checkpoint_path(path)
+        self.path = path
+        self.fsync_interval = fsync_interval
+        self.file = open_checkpoint(path, "a")
+        self.queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self.error: Optional[BaseException] = None
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def write(self, result: EnvRunResult) -> None:
+        if self.error is not None:
+            raise self.error
+        self.queue.put(json.dumps(result.model_dump()) + "\n")
+
+    def _sync(self) -> None:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def _run(self) -> None:
+        try:
+            last_sync = time.monotonic()
+            dirty = False
+            while True:
+                timeout = None
+                if dirty:
+                    timeout = max(0.0, last_sync + self.fsync_interval - time.monotonic())
+                try:
+                    line = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    line = ""
+                if line:
+                    self.file.write(line)
+                    dirty = True
+                if dirty and (
+                    line is None
+                    or self.queue.empty()
+                    or time.monotonic() - last_sync >= self.fsync_interval
+                ):
+                    self._sync()
+                    last_sync = time.monotonic()
+                    dirty = False
+                if line is None:
+                    break
+        except BaseException as e:
+            self.error = e
+        finally:
+            self.file.close()
+
+    def close(self) -> None:
+        if self.thread.is_alive():
+            self.queue.put(None)
+            self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def __enter__(self) -> "CheckpointWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def read_lines(path: str) -> Tuple[List[str], bool]:
+    """Reads the lines of a checkpoint; also returns whether it ends in a partially written line."""
+    lines: List[str] = []
+    with open_checkpoint(path, "r") as f:
+        try:
+            for line in f:
+                lines.append(line)
+        except EOFError:
+            # a gzip stream that was not closed
+            return lines, True
+    return lines, len(lines) > 0 and not lines[-1].endswith("\n")
+
+
+def load_checkpoint(path: str) -> List[EnvRunResult]:
+    """Reads the results of a JSON Lines checkpoint, or of a consolidated JSON results file.
+
+    A line cut short by a crash is skipped.
+    """
+    lines, _ = read_lines(path)
+    if len(lines) > 0 and lines[0].startswith("["):
+        return [EnvRunResult.model_validate(r) for r in json.loads("".join(lines))]
+    results: List[EnvRunResult] = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            results.append(EnvRunResult.model_validate_json(line))
+        except ValueError:
+            continue
+    return results
+
+
+def repair_checkpoint(path: str) -> None:
+    """Drops the partially written tail a crash may have left, so that results can be appended."""
+    check_checkpoint_path(path)
+    if not os.path.exists(path):
+        return
+    lines, truncated = read_lines(path)
+    if not truncated:
+        return
+    if len(lines) > 0 and not lines[-1].endswith("\n"):
+        lines.pop()
+    root, ext = os.path.splitext(path)
+    # keeps the extension, which decides whether the file is compressed
+    tmp_path = root + ".tmp" + ext
+    with open_checkpoint(tmp_path, "w") as f:
+        f.writelines(lines)
+    os.replace(tmp_path, path)
+
+
+def merge_results(paths: List[str]) -> List[EnvRunResult]:
+    """Combines the results of several checkpoints or results files, e.g. the shards of a run.
+
+    Of several results for the same (task_id, trial), e.g. after a resumed run, the last one
+    wins, except that a result that ended in an error does not replace one that completed.
+    """
+    merged: Dict[Tuple[int, int], EnvRunResult] = {}
+    for path in paths:
+        for result in load_checkpoint(path):
+            key = (result.task_id, result.trial)
+            if "error" in result.info and key in merged and "error" not in merged[key].info:
+                continue
+            merged[key] = result
+    return sorted(merged.values(), key=lambda result: (result.trial, result.task_id))
+
+
+def load_completed_results(path: str) -> List[EnvRunResult]:
+    """Loads the results of a checkpoint that completed, i.e. did not end in an error."""
+    return [result for result in merge_results([path]) if "error" not in result.info]
+
+
+def checkpoint_path_for(results_path: str, compress: bool = False) -> str:
+    """The JSON Lines checkpoint written while producing the JSON results file `results_path`."""
+    return results_path[: -len(".json")] + (".jsonl.gz" if compress else ".jsonl")
+
+
+def results_path_for(checkpoint_path: str) -> str:
+    """The JSON results file consolidated from the checkpoint at `checkpoint_path`."""
+    check_checkpoint_path(checkpoint_path)
+    path = checkpoint_path[: -len(".gz")] if checkpoint_path.endswith(".gz") else checkpoint_path
+    return path[: -len(".jsonl")] + ".json"
+
+
+def write_results(path: str, results: List[EnvRunResult]) -> None:
+    """Writes `results` as one consolidated JSON list, the format of the final results file."""
+    with open(path, "w") as f:
+        json.dump([result.model_dump() for result in results], f, indent=2)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Consolidate a JSON Lines run checkpoint into a JSON results file"
+    )
+    parser.add_argument("checkpoint", type=str, help="Path to a .jsonl or .jsonl.gz checkpoint")
+    parser.add_argument("output", type=str, help="Path of the JSON results file to write")
+    args = parser.parse_args()
+    results = load_checkpoint(args.checkpoint)
+    write_results(args.output, results)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
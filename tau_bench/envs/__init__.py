@@ -1,6 +1,6 @@
 # Copyright Sierra
 
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 from tau_bench.envs.base import Env
 from tau_bench.envs.user import UserStrategy
 
@@ -12,6 +12,8 @@ def get_env(
     task_split: str,
     user_provider: Optional[str] = None,
     task_index: Optional[int] = None,
+    reward_mode: str = "hash",
+    observation_encoding: Tuple[str, ...] = (),
 ) -> Env:
     if env_name == "retail":
         from tau_bench.envs.retail import MockRetailDomainEnv
@@ -22,6 +24,8 @@ def get_env(
             task_split=task_split,
             user_provider=user_provider,
             task_index=task_index,
+            reward_mode=reward_mode,
+            observation_encoding=observation_encoding,
         )
     elif env_name == "airline":
         from tau_bench.envs.airline import MockAirlineDomainEnv
@@ -32,6 +36,8 @@ def get_env(
             task_split=task_split,
             user_provider=user_provider,
             task_index=task_index,
+            reward_mode=reward_mode,
+            observation_encoding=observation_encoding,
         )
     else:
         raise ValueError(f"Unknown environment: {env_name}")
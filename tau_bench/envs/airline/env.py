@@ -5,7 +5,8 @@ from tau_bench.envs.airline.rules import RULES
 from tau_bench.envs.airline.tools import ALL_TOOLS
 from tau_bench.envs.airline.wiki import WIKI
 from tau_bench.envs.base import Env
-from typing import Optional, Union
+from tau_bench.envs.gt_cache import load_gt_hash_cache
+from typing import Optional, Tuple, Union
 from tau_bench.envs.user import UserStrategy
 
 
@@ -17,6 +18,8 @@ class MockAirlineDomainEnv(Env):
         user_provider: Optional[str] = None,
         task_split: str = "test",
         task_index: Optional[int] = None,
+        reward_mode: str = "hash",
+        observation_encoding: Tuple[str, ...] = (),
     ):
         match task_split:
             case "test":
@@ -33,5 +36,14 @@ class MockAirlineDomainEnv(Env):
             user_model=user_model,
             user_provider=user_provider,
             task_index=task_index,
+            reward_mode=reward_mode,
+            observation_encoding=observation_encoding,
         )
         self.terminate_tools = ["transfer_to_human_agents"]
+        self.gt_hash_cache = load_gt_hash_cache(
+            env_name="airline",
+            task_split=task_split,
+            data_load_func=load_data,
+            tools=ALL_TOOLS,
+            env_file=__file__,
+        )
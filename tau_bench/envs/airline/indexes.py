@@ -0,0 +1,137 @@
+# Copyright Sierra
+
+import re
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+from tau_bench.envs.db import Database, lookup_records
+
+DATE_FORMAT = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def route_keys(flight: Dict[str, Any]) -> List[Tuple[str, str]]:
+    return [(flight["origin"], flight["destination"])]
+
+
+def available_departure_keys(flight: Dict[str, Any]) -> List[Tuple[str, str]]:
+    return [
+        (flight["origin"], date)
+        for date, info in flight["dates"].items()
+        if info["status"] == "available"
+    ]
+
+
+def flights_on_route(
+    data: Dict[str, Any], origin: str, destination: str
+) -> List[Dict[str, Any]]:
+    """The flights from `origin` to `destination`, in table order."""
+    return [
+        flight
+        for _, flight in lookup_records(data, "flights", route_keys, (origin, destination))
+    ]
+
+
+def available_departures(
+    data: Dict[str, Any], origin: str, date: str
+) -> List[Dict[str, Any]]:
+    """The flights from `origin` that are available on `date`, in table order."""
+    return [
+        flight
+        for _, flight in lookup_records(
+            data, "flights", available_departure_keys, (origin, date)
+        )
+    ]
+
+
+def connection_date(flight1: Dict[str, Any], date: str) -> str:
+    """The date of the second leg of a connection whose first leg departs on `date`."""
+    return (
+        f"2024-05-{int(date[-2:])+1}"
+        if "+1" in flight1["scheduled_arrival_time_est"]
+        else date
+    )
+
+
+def is_feasible_connection(
+    flight1: Dict[str, Any], flight2: Dict[str, Any], date2: str
+) -> bool:
+    # the first leg is assumed to be available on its date
+    return (
+        flight1["scheduled_arrival_time_est"] <= flight2["scheduled_departure_time_est"]
+        and date2 in flight2["dates"]
+        and flight2["dates"][date2]["status"] == "available"
+    )
+
+
+def build_flight_dates(flights: Dict[str, Dict[str, Any]]) -> FrozenSet[str]:
+    """The dates on which any flight is scheduled."""
+    return frozenset(date for flight in flights.values() for date in flight["dates"])
+
+
+def build_connections(
+    flights: Dict[str, Dict[str, Any]], date: str
+) -> Dict[Tuple[str, str], List[Tuple[str, str, str]]]:
+    """The feasible `(flight1, flight2, date2)` connections departing on `date`, by (origin, destination).
+
+    Each list is ordered by the table position of the first and then the second
+    leg, the order in which a nested scan of the flights table finds them.
+    """
+    by_origin: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+    for flight_number, flight in flights.items():
+        by_origin.setdefault(flight["origin"], []).append((flight_number, flight))
+    connections: Dict[Tuple[str, str], List[Tuple[str, str, str]]] = {}
+    for flight_number1, flight1 in flights.items():
+        if date not in flight1["dates"] or flight1["dates"][date]["status"] != "available":
+            continue
+        date2 = connection_date(flight1, date)
+        for flight_number2, flight2 in by_origin.get(flight1["destination"], []):
+            if is_feasible_connection(flight1, flight2, date2):
+                connections.setdefault(
+                    (flight1["origin"], flight2["destination"]), []
+                ).append((flight_number1, flight_number2, date2))
+    return connections
+
+
+def onestop_connections(
+    data: Dict[str, Any], origin: str, destination: str, date: str
+) -> List[Tuple[Dict[str, Any], Dict[str, Any], str]]:
+    """The feasible one-stop `(flight1, flight2, date2)` itineraries, in table order.
+
+    On a `Database` they come from a per-date connection table of the base
+    snapshot, unless the episode touched a flight that could be a leg of one,
+    in which case they are recomputed from the route indexes. Raises a
+    `ValueError` if `date` is not in the format YYYY-MM-DD.
+    """
+    if not (isinstance(date, str) and DATE_FORMAT.fullmatch(date)):
+        raise ValueError(f"Invalid date {date!r}, expected the format YYYY-MM-DD")
+    if isinstance(data, Database):
+        flights = data["flights"]
+        base = data.snapshot.tables["flights"]
+        touched = flights.touched()
+        if not any(
+            record["origin"] == origin or record["destination"] == destination
+            for key in touched
+            for record in [base.get(key), flights.peek(key) if key in flights else None]
+            if record is not None
+        ):
+            # only dates that some flight is scheduled on get a connection table,
+            # which bounds the cache; on any other date no first leg is available
+            if date not in data.snapshot.derived(
+                "flight_dates", lambda: build_flight_dates(base)
+            ):
+                return []
+            connections = data.snapshot.derived(
+                ("onestop_connections", date), lambda: build_connections(base, date)
+            )
+            return [
+                (flights.peek(flight_number1), flights.peek(flight_number2), date2)
+                for flight_number1, flight_number2, date2 in connections.get(
+                    (origin, destination), []
+                )
+            ]
+    return [
+        (flight1, flight2, date2)
+        for flight1 in available_departures(data, origin, date)
+        for date2 in [connection_date(flight1, date)]
+        for flight2 in flights_on_route(data, flight1["destination"], destination)
+        if is_feasible_connection(flight1, flight2, date2)
+    ]
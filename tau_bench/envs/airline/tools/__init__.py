@@ -14,20 +14,24 @@ from .transfer_to_human_agents import TransferToHumanAgents
 from .update_reservation_baggages import UpdateReservationBaggages
 from .update_reservation_flights import UpdateReservationFlights
 from .update_reservation_passengers import UpdateReservationPassengers
+from tau_bench.envs.tool_registry import ToolRegistry
 
-ALL_TOOLS = [
-    BookReservation,
-    Calculate,
-    CancelReservation,
-    GetReservationDetails,
-    GetUserDetails,
-    ListAllAirports,
-    SearchDirectFlight,
-    SearchOnestopFlight,
-    SendCertificate,
-    Think,
-    TransferToHumanAgents,
-    UpdateReservationBaggages,
-    UpdateReservationFlights,
-    UpdateReservationPassengers,
-]
+
+ALL_TOOLS = ToolRegistry(
+    [
+        BookReservation,
+        Calculate,
+        CancelReservation,
+        GetReservationDetails,
+        GetUserDetails,
+        ListAllAirports,
+        SearchDirectFlight,
+        SearchOnestopFlight,
+        SendCertificate,
+        Think,
+        TransferToHumanAgents,
+        UpdateReservationBaggages,
+        UpdateReservationFlights,
+        UpdateReservationPassengers,
+    ]
+)
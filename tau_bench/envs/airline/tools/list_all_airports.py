@@ -4,55 +4,61 @@ import json
 from typing import Any, Dict
 from tau_bench.envs.tool import Tool
 
+AIRPORTS = [
+    "SFO",
+    "JFK",
+    "LAX",
+    "ORD",
+    "DFW",
+    "DEN",
+    "SEA",
+    "ATL",
+    "MIA",
+    "BOS",
+    "PHX",
+    "IAH",
+    "LAS",
+    "MCO",
+    "EWR",
+    "CLT",
+    "MSP",
+    "DTW",
+    "PHL",
+    "LGA",
+]
+CITIES = [
+    "San Francisco",
+    "New York",
+    "Los Angeles",
+    "Chicago",
+    "Dallas",
+    "Denver",
+    "Seattle",
+    "Atlanta",
+    "Miami",
+    "Boston",
+    "Phoenix",
+    "Houston",
+    "Las Vegas",
+    "Orlando",
+    "Newark",
+    "Charlotte",
+    "Minneapolis",
+    "Detroit",
+    "Philadelphia",
+    "LaGuardia",
+]
+
+# static, so serialized once
+AIRPORTS_JSON = json.dumps({airport: city for airport, city in zip(AIRPORTS, CITIES)})
+
 
 class ListAllAirports(Tool):
+    read_only = True
+
     @staticmethod
     def invoke(data: Dict[str, Any]) -> str:
-        airports = [
-            "SFO",
-            "JFK",
-            "LAX",
-            "ORD",
-            "DFW",
-            "DEN",
-            "SEA",
-            "ATL",
-            "MIA",
-            "BOS",
-            "PHX",
-            "IAH",
-            "LAS",
-            "MCO",
-            "EWR",
-            "CLT",
-            "MSP",
-            "DTW",
-            "PHL",
-            "LGA",
-        ]
-        cities = [
-            "San Francisco",
-            "New York",
-            "Los Angeles",
-            "Chicago",
-            "Dallas",
-            "Denver",
-            "Seattle",
-            "Atlanta",
-            "Miami",
-            "Boston",
-            "Phoenix",
-            "Houston",
-            "Las Vegas",
-            "Orlando",
-            "Newark",
-            "Charlotte",
-            "Minneapolis",
-            "Detroit",
-            "Philadelphia",
-            "LaGuardia",
-        ]
-        return json.dumps({airport: city for airport, city in zip(airports, cities)})
+        return AIRPORTS_JSON
 
     @staticmethod
     def get_info() -> Dict[str, Any]:
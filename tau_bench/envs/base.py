@@ -1,13 +1,28 @@
 # Copyright Sierra
 
+import copy
 import random
-from hashlib import sha256
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from tau_bench.envs.db import (
+    Database,
+    Hashable as Hashable,
+    ToHashable as ToHashable,
+    consistent_hash as consistent_hash,
+    load_snapshot,
+    to_hashable as to_hashable,
+)
+from tau_bench.envs.observation import OBSERVATION_ENCODING_OPTIONS, encode_observation
 from tau_bench.envs.tool import Tool
-from typing import Any, Callable, Dict, List, Type, Optional, Set, Union, Tuple
+from tau_bench.envs.tool_registry import ToolRegistry
+from tau_bench.envs.tool_schema import format_argument_errors
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Type, Optional, Tuple, Union
 
 from tau_bench.envs.user import load_user, UserStrategy
 from tau_bench.types import (
     Action,
+    ArgumentError,
     Task,
     EnvInfo,
     EnvResetResponse,
@@ -15,37 +30,24 @@ from tau_bench.types import (
     RewardResult,
     RewardOutputInfo,
     RewardActionInfo,
+    ToolProfile,
     RESPOND_ACTION_NAME,
 )
 
-ToHashable = Union[
-    str, int, float, Dict[str, "ToHashable"], List["ToHashable"], Set["ToHashable"]
-]
-Hashable = Union[str, int, float, Tuple["Hashable"], Tuple[Tuple[str, "Hashable"]]]
-
-
-def to_hashable(item: ToHashable) -> Hashable:
-    if isinstance(item, dict):
-        return tuple((key, to_hashable(value)) for key, value in sorted(item.items()))
-    elif isinstance(item, list):
-        return tuple(to_hashable(element) for element in item)
-    elif isinstance(item, set):
-        return tuple(sorted(to_hashable(element) for element in item))
-    else:
-        return item
-
+if TYPE_CHECKING:
+    # imported lazily so that `python -m tau_bench.envs.gt_cache` runs cleanly
+    from tau_bench.envs.gt_cache import GroundTruthHashCache
 
-def consistent_hash(
-    value: Hashable,
-) -> str:
-    return sha256(str(value).encode("utf-8")).hexdigest()
+# "hash" compares digests of the whole final state, "diff" structurally compares
+# the records touched by the agent or the ground truth and reports the differences
+REWARD_MODES = ["hash", "diff"]
 
 
 class Env(object):
     def __init__(
         self,
         data_load_func: Callable[[], Dict[str, Any]],
-        tools: List[Type[Tool]],
+        tools: Union[ToolRegistry, List[Type[Tool]]],
         tasks: List[Task],
         wiki: str,
         rules: List[str],
@@ -53,15 +55,25 @@ class Env(object):
         user_model: str,
         user_provider: Optional[str] = None,
         task_index: Optional[int] = None,
+        reward_mode: str = "hash",
+        observation_encoding: Tuple[str, ...] = (),
     ) -> None:
         super().__init__()
+        if reward_mode not in REWARD_MODES:
+            raise ValueError(f"Unknown reward mode: {reward_mode}")
+        for option in observation_encoding:
+            if option not in OBSERVATION_ENCODING_OPTIONS:
+                raise ValueError(f"Unknown observation encoding option: {option}")
         self.data_load_func = data_load_func
-        self.data = data_load_func()
-        self.tools_map: Dict[str, Type[Tool]] = {
-            tool.get_info()["function"]["name"]: tool for tool in tools
-        }
-        self.tools_info = [tool.get_info() for tool in tools]
+        self.snapshot = load_snapshot(data_load_func)
+        self.data: Database = self.snapshot.checkout()
+        if not isinstance(tools, ToolRegistry):
+            tools = ToolRegistry(tools)
+        self.tools_map = tools.tools_map
+        self.tools_info = tools.tools_info
+        self.tool_validators = tools.validators
         self.terminate_tools = []
+        self.gt_hash_cache: Optional["GroundTruthHashCache"] = None
         self.tasks = tasks
         if task_index is not None:
             self.task_index = task_index
@@ -70,40 +82,129 @@ class Env(object):
         self.task = tasks[self.task_index]
         self.wiki = wiki
         self.rules = rules
+        self.user_strategy = user_strategy
+        self.user_model = user_model
+        self.user_provider = user_provider
         self.user = load_user(
             user_strategy=user_strategy, model=user_model, provider=user_provider
         )
         self.actions: List[Action] = []
+        self.checkpoint_num_actions: List[int] = []
+        self.reward_mode = reward_mode
+        # applied to the JSON observations of every tool, see tau_bench.envs.observation
+        self.observation_encoding = tuple(observation_encoding)
+        # threads for the read-only tool calls of a batch; the tools are in-memory
+        # and hold the GIL, so this only pays off for tools that wait on I/O
+        self.max_tool_workers = 1
+        # opt-in per-tool time and observation size, reported in EnvInfo.tool_profile
+        self.profile_tools = False
+        self.tool_profile: Dict[str, ToolProfile] = {}
+        self.tool_profile_lock = threading.Lock()
+
+    def new_episode(self, task_index: Optional[int] = None) -> "Env":
+        """Creates an independent env that shares the tools, tasks, wiki and base snapshot of this one."""
+        episode = copy.copy(self)
+        episode.data = self.snapshot.checkout()
+        episode.user = load_user(
+            user_strategy=self.user_strategy,
+            model=self.user_model,
+            provider=self.user_provider,
+        )
+        episode.actions = []
+        episode.checkpoint_num_actions = []
+        episode.tool_profile = {}
+        episode.tool_profile_lock = threading.Lock()
+        if task_index is not None:
+            episode.task_index = task_index
+            episode.task = self.tasks[task_index]
+        return episode
+
+    def fork(self) -> "Env":
+        """Branches the current episode into an independent env, e.g. for tree search.
+
+        The child shares the base snapshot and the user simulator's conversation
+        so far with this env, and only copies the records this episode touched.
+        """
+        child = copy.copy(self)
+        child.data = self.data.fork()
+        child.user = self.user.fork()
+        child.actions = list(self.actions)
+        child.checkpoint_num_actions = []
+        child.tool_profile = {
+            name: profile.model_copy() for name, profile in self.tool_profile.items()
+        }
+        child.tool_profile_lock = threading.Lock()
+        return child
 
     def reset(self, task_index: Optional[int] = None) -> EnvResetResponse:
-        if task_index is None:
-            task_index = random.randint(0, len(self.tasks))
-        self.task_index = task_index
-        self.data = self.data_load_func()
-        self.task = self.tasks[task_index]
-        self.actions = []
+        self.start_task(task_index)
         initial_observation = self.user.reset(instruction=self.task.instruction)
         return EnvResetResponse(
             observation=initial_observation, info=EnvInfo(task=self.task, source="user")
         )
 
+    async def areset(self, task_index: Optional[int] = None) -> EnvResetResponse:
+        self.start_task(task_index)
+        initial_observation = await self.user.areset(instruction=self.task.instruction)
+        return EnvResetResponse(
+            observation=initial_observation, info=EnvInfo(task=self.task, source="user")
+        )
+
+    def start_task(self, task_index: Optional[int] = None) -> None:
+        if task_index is None:
+            task_index = random.randint(0, len(self.tasks))
+        self.task_index = task_index
+        self.rollback()
+        self.tool_profile = {}
+        self.task = self.tasks[task_index]
+
+    def checkpoint(self) -> int:
+        """Saves the current database state and action log; returns an id for `rollback`."""
+        self.checkpoint_num_actions.append(len(self.actions))
+        return self.data.checkpoint()
+
+    def rollback(self, checkpoint: Optional[int] = None) -> None:
+        """Undoes the writes and actions since `checkpoint`, or since the start of the episode."""
+        self.data.rollback(checkpoint)
+        if checkpoint is None:
+            self.actions = []
+            self.checkpoint_num_actions = []
+        else:
+            self.actions = self.actions[: self.checkpoint_num_actions[checkpoint - 1]]
+            del self.checkpoint_num_actions[checkpoint - 1 :]
+
+    def commit(self, checkpoint: int) -> None:
+        """Keeps the writes and actions since `checkpoint` and discards the checkpoint."""
+        self.data.commit(checkpoint)
+        del self.checkpoint_num_actions[checkpoint - 1 :]
+
     def step(self, action: Action) -> EnvResponse:
+        user_observation = None
+        if action.name == RESPOND_ACTION_NAME:
+            user_observation = self.user.step(action.kwargs["content"])
+        return self.apply_action(action, user_observation)
+
+    async def astep(self, action: Action) -> EnvResponse:
+        """Like `step`, but awaits the user simulator; tool calls still run inline."""
+        user_observation = None
+        if action.name == RESPOND_ACTION_NAME:
+            user_observation = await self.user.astep(action.kwargs["content"])
+        return self.apply_action(action, user_observation)
+
+    def apply_action(
+        self, action: Action, user_observation: Optional[str] = None
+    ) -> EnvResponse:
         self.actions.append(action)
 
         info = EnvInfo(task=self.task)
         reward = 0
         done = False
         if action.name == RESPOND_ACTION_NAME:
-            observation = self.user.step(action.kwargs["content"])
+            observation = user_observation
             info.source = "user"
             done = "###STOP###" in observation
         elif action.name in self.tools_map:
-            try:
-                observation = self.tools_map[action.name].invoke(
-                    data=self.data, **action.kwargs
-                )
-            except Exception as e:
-                observation = f"Error: {e}"
+            observation, info.argument_errors = self.run_tool(action)
             info.source = action.name
             if action.name in self.terminate_tools:
                 done = True
@@ -111,33 +212,139 @@ class Env(object):
             observation = f"Unknown action {action.name}"
             info.source = action.name
 
+        # agents merge the infos of all steps, so it is reported on every step
+        info.tool_profile = self.get_tool_profile()
         if done:
+            # read before the ground-truth replay in calculate_reward adds to it
+            info.observation_cache = dict(self.data.observation_stats)
             reward_res = self.calculate_reward()
             reward = reward_res.reward
             info.reward_info = reward_res
             info.user_cost = self.user.get_total_cost()
         return EnvResponse(observation=observation, reward=reward, done=done, info=info)
 
+    def invoke_tool(self, action: Action) -> str:
+        try:
+            return self.tools_map[action.name].invoke(data=self.data, **action.kwargs)
+        except Exception as e:
+            return f"Error: {e}"
+
+    def run_tool(self, action: Action) -> Tuple[str, Optional[List[ArgumentError]]]:
+        """Validates the arguments of a tool call against the tool's schema before invoking it."""
+        start = time.perf_counter()
+        errors = self.tool_validators[action.name](action.kwargs)
+        if errors:
+            observation = format_argument_errors(errors)
+        else:
+            observation = encode_observation(
+                self.invoke_tool(action), self.observation_encoding
+            )
+            errors = None
+        if self.profile_tools:
+            self.record_tool_call(action.name, time.perf_counter() - start, observation)
+        return observation, errors
+
+    def record_tool_call(self, name: str, elapsed: float, observation: str) -> None:
+        with self.tool_profile_lock:
+            profile = self.tool_profile.setdefault(name, ToolProfile())
+            profile.calls += 1
+            profile.time += elapsed
+            profile.bytes += len(observation.encode("utf-8"))
+            # roughly 4 characters per token for English and JSON
+            profile.tokens += (len(observation) + 3) // 4
+
+    def get_tool_profile(self) -> Optional[Dict[str, ToolProfile]]:
+        if not self.profile_tools:
+            return None
+        with self.tool_profile_lock:
+            return {
+                name: profile.model_copy() for name, profile in self.tool_profile.items()
+            }
+
+    def is_read_only(self, action: Action) -> bool:
+        return action.name in self.tools_map and self.tools_map[action.name].read_only
+
+    def step_batch(self, actions: List[Action]) -> List[EnvResponse]:
+        """Executes several actions of one agent turn, e.g. parallel tool calls.
+
+        The actions take effect in order. Runs of consecutive read-only tool
+        calls are executed concurrently when `max_tool_workers > 1`. The batch
+        stops after an action that ends the episode, so fewer responses than
+        actions may be returned.
+        """
+        responses: List[EnvResponse] = []
+        i = 0
+        while i < len(actions):
+            j = i
+            while j < len(actions) and self.is_read_only(actions[j]):
+                j += 1
+            if self.max_tool_workers > 1 and j - i > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(self.max_tool_workers, j - i)
+                ) as executor:
+                    results = list(executor.map(self.run_tool, actions[i:j]))
+                for action, (observation, errors) in zip(actions[i:j], results):
+                    self.actions.append(action)
+                    info = EnvInfo(
+                        task=self.task,
+                        source=action.name,
+                        argument_errors=errors,
+                        tool_profile=self.get_tool_profile(),
+                    )
+                    responses.append(
+                        EnvResponse(
+                            observation=observation, reward=0, done=False, info=info
+                        )
+                    )
+                i = j
+                continue
+            responses.append(self.step(actions[i]))
+            i += 1
+            if responses[-1].done:
+                break
+        return responses
+
     def get_data_hash(self) -> str:
-        return consistent_hash(to_hashable(self.data))
+        # the data is always a `Database`, whose per-record digests the ground truth is hashed with
+        return self.data.digest()
+
+    def compute_gt_data_hash(self) -> str:
+        self.data.rollback()
+        self.checkpoint_num_actions = []
+        for action in self.task.actions:
+            if action.name not in self.terminate_tools:
+                self.step(action)
+        return self.get_data_hash()
+
+    def get_gt_data_hash(self) -> str:
+        if self.gt_hash_cache is None:
+            return self.compute_gt_data_hash()
+        gt_data_hash = self.gt_hash_cache.get(self.task_index, self.task)
+        if gt_data_hash is None:
+            gt_data_hash = self.compute_gt_data_hash()
+            self.gt_hash_cache.put(self.task_index, self.task, gt_data_hash)
+        return gt_data_hash
 
     def calculate_reward(self) -> RewardResult:
-        data_hash = self.get_data_hash()
         reward = 1.0
         actions = [
             action for action in self.task.actions if action.name != RESPOND_ACTION_NAME
         ]
 
         # Check if the database changes are correct. If they are not correct, then we set the reward to 0.
-        # TODO: cache gt_data_hash in tasks.py (low priority)
-        self.data = self.data_load_func()
-        for action in self.task.actions:
-            if action.name not in self.terminate_tools:
-                self.step(action)
-        gt_data_hash = self.get_data_hash()
-        info = RewardActionInfo(
-            r_actions=data_hash == gt_data_hash, gt_data_hash=gt_data_hash
-        )
+        if self.reward_mode == "diff":
+            gt_env = self.new_episode(task_index=self.task_index)
+            gt_data_hash = gt_env.compute_gt_data_hash()
+            data_diff = self.data.diff(gt_env.data)
+            info = RewardActionInfo(
+                r_actions=not data_diff, gt_data_hash=gt_data_hash, data_diff=data_diff
+            )
+        else:
+            data_hash = self.get_data_hash()
+            gt_data_hash = self.get_gt_data_hash()
+            info = RewardActionInfo(
+                r_actions=data_hash == gt_data_hash, gt_data_hash=gt_data_hash
+            )
         if not info.r_actions:
             reward = 0.0
 
@@ -159,6 +366,11 @@ class Env(object):
                 if not found:
                     r_outputs = 0.0
                     reward = 0.0
-            info = RewardOutputInfo(r_outputs=r_outputs, outputs=outputs)
-            
+            info = RewardOutputInfo(
+                r_outputs=r_outputs,
+                outputs=outputs,
+                r_actions=info.r_actions,
+                data_diff=info.data_diff,
+            )
+
         return RewardResult(reward=reward, info=info, actions=actions)
@@ -0,0 +1,111 @@
+# Copyright Sierra
+
+import gc
+import json
+import os
+import pickle
+import struct
+from hashlib import sha256
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+SNAPSHOT_FILENAME = "snapshot.pkl"
+SNAPSHOT_MAGIC = b"TAUSNAP1"
+SNAPSHOT_VERSION = 1
+
+T = TypeVar("T")
+
+# layout: magic | u32 header length | JSON header | sha256(payload) | pickled tables
+
+
+def without_gc(func: Callable[[], T]) -> T:
+    # deserializing allocates millions of containers, which otherwise triggers many useless collections
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return func()
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def source_stamps(folder: str, tables: Dict[str, str]) -> Dict[str, Any]:
+    stamps = {}
+    for filename in tables.values():
+        stat = os.stat(os.path.join(folder, filename))
+        stamps[filename] = [stat.st_size, stat.st_mtime_ns]
+    return stamps
+
+
+def build_snapshot(folder: str, tables: Dict[str, str]) -> str:
+    """Compiles the JSON tables in `folder` into a pickle protocol 5 snapshot."""
+    data = load_json_tables(folder, tables)
+    payload = pickle.dumps(data, protocol=5)
+    header = json.dumps(
+        {"version": SNAPSHOT_VERSION, "sources": source_stamps(folder, tables)}
+    ).encode("utf-8")
+    path = os.path.join(folder, SNAPSHOT_FILENAME)
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        f.write(sha256(payload).digest())
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_snapshot(folder: str, tables: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """Returns the tables from the snapshot, or None if it is missing, stale or corrupt."""
+    try:
+        with open(os.path.join(folder, SNAPSHOT_FILENAME), "rb") as f:
+            content = f.read()
+        if content[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            return None
+        offset = len(SNAPSHOT_MAGIC)
+        (header_length,) = struct.unpack_from("<I", content, offset)
+        offset += 4
+        header = json.loads(content[offset : offset + header_length])
+        offset += header_length
+        if header["version"] != SNAPSHOT_VERSION or header["sources"] != source_stamps(
+            folder, tables
+        ):
+            return None
+        checksum, payload = content[offset : offset + 32], content[offset + 32 :]
+        if sha256(payload).digest() != checksum:
+            return None
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+    return without_gc(lambda: pickle.loads(payload))
+
+
+def load_json_tables(folder: str, tables: Dict[str, str]) -> Dict[str, Any]:
+    def load() -> Dict[str, Any]:
+        data = {}
+        for name, filename in tables.items():
+            with open(os.path.join(folder, filename)) as f:
+                data[name] = json.load(f)
+        return data
+
+    return without_gc(load)
+
+
+def load_tables(folder: str, tables: Dict[str, str]) -> Dict[str, Any]:
+    """Loads the tables from the compiled snapshot if it is fresh, falling back to the JSON files."""
+    data = read_snapshot(folder, tables)
+    if data is None:
+        data = load_json_tables(folder, tables)
+    return data
+
+
+def main() -> None:
+    from tau_bench.envs.airline import data as airline_data
+    from tau_bench.envs.retail import data as retail_data
+
+    for module in [airline_data, retail_data]:
+        path = build_snapshot(module.FOLDER_PATH, module.TABLES)
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
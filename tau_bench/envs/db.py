@@ -0,0 +1,486 @@
+# Copyright Sierra
+
+import json
+import threading
+from collections.abc import Mapping, MutableMapping
+from hashlib import sha256
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable as HashableKey,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+ToHashable = Union[
+    str,
+    int,
+    float,
+    Mapping[str, "ToHashable"],
+    List["ToHashable"],
+    Set["ToHashable"],
+]
+Hashable = Union[str, int, float, Tuple["Hashable"], Tuple[Tuple[str, "Hashable"]]]
+
+DIGEST_MODULUS = 1 << 256
+
+# undo log entry for a record that was not in the overlay
+MISSING = object()
+
+
+def to_hashable(item: ToHashable) -> Hashable:
+    if isinstance(item, Mapping):
+        return tuple((key, to_hashable(value)) for key, value in sorted(item.items()))
+    elif isinstance(item, list):
+        return tuple(to_hashable(element) for element in item)
+    elif isinstance(item, set):
+        return tuple(sorted(to_hashable(element) for element in item))
+    else:
+        return item
+
+
+def consistent_hash(
+    value: Hashable,
+) -> str:
+    return sha256(str(value).encode("utf-8")).hexdigest()
+
+
+def record_digest(key: str, record: Any) -> int:
+    try:
+        encoded = json.dumps([key, record], sort_keys=True, separators=(",", ":"))
+    except TypeError:
+        # not plain JSON (e.g. a tool stored a set), fall back to the generic encoding
+        encoded = str(to_hashable([key, record]))
+    return int.from_bytes(sha256(encoded.encode("utf-8")).digest(), "big")
+
+
+class BaseDigests(object):
+    """Lazily computed digests of every record of a base table, shared by all episodes."""
+
+    def __init__(self, base: Dict[str, Any]) -> None:
+        self.base = base
+        self.lock = threading.Lock()
+        self.entries: Optional[Dict[str, int]] = None
+        self.total = 0
+
+    def get(self) -> Tuple[Dict[str, int], int]:
+        with self.lock:
+            if self.entries is None:
+                entries = {key: record_digest(key, record) for key, record in self.base.items()}
+                self.total = sum(entries.values()) % DIGEST_MODULUS
+                self.entries = entries
+            return self.entries, self.total
+
+
+def copy_json(value: Any) -> Any:
+    # the mock databases only contain JSON values, so this is a much cheaper deepcopy
+    if isinstance(value, dict):
+        return {k: copy_json(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [copy_json(v) for v in value]
+    return value
+
+
+def diff_values(a: Any, b: Any, path: str, out: List[str]) -> None:
+    """Appends to `out` the paths (e.g. `orders/#W2378156/items/0/price`) at which `a` and `b` differ."""
+    if isinstance(a, dict) and isinstance(b, dict):
+        for key in sorted(set(a) | set(b), key=str):
+            if key not in a or key not in b:
+                out.append(f"{path}/{key}")
+            else:
+                diff_values(a[key], b[key], f"{path}/{key}", out)
+    elif isinstance(a, list) and isinstance(b, list):
+        for i in range(max(len(a), len(b))):
+            if i >= len(a) or i >= len(b):
+                out.append(f"{path}/{i}")
+            else:
+                diff_values(a[i], b[i], f"{path}/{i}", out)
+    # compare types too so that e.g. 1 and 1.0 differ, as they do in the digest
+    elif type(a) is not type(b) or a != b:
+        out.append(path)
+
+
+class CowTable(MutableMapping):
+    """A copy-on-write view of one table (e.g. `orders`) of a base snapshot.
+
+    Records are copied into the overlay the first time they are fetched by key,
+    so tools can keep mutating them in place. Records yielded by iteration
+    (`values()`, `items()`) are not copied and must be treated as read-only.
+
+    While the owning `Database` has open checkpoints, the state of a record is
+    saved to the journal the first time it is fetched, set or deleted after the
+    latest checkpoint, which is what `Database.rollback()` restores.
+
+    Every fetch, set, delete or restore of a record bumps its version, which
+    keys the cache of serialized records behind `dumps()`.
+    """
+
+    def __init__(
+        self,
+        base: Dict[str, Any],
+        base_digests: BaseDigests,
+        journal: List["JournalFrame"],
+        base_observations: Dict[str, str],
+        observation_stats: Dict[str, int],
+    ) -> None:
+        self._base = base
+        self._base_digests = base_digests
+        self._journal = journal
+        self._overlay: Dict[str, Any] = {}
+        self._deleted: Set[str] = set()
+        self._versions: Dict[str, int] = {}
+        self._base_observations = base_observations
+        self._observations: Dict[str, Tuple[int, str]] = {}
+        self._observation_stats = observation_stats
+
+    def _bump(self, key: str) -> None:
+        # versions only ever grow, even across rollbacks, so a stale observation can never match
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+    def _log(self, key: str) -> None:
+        frame = self._journal[-1]
+        if (id(self), key) in frame.logged:
+            return
+        frame.logged.add((id(self), key))
+        record = copy_json(self._overlay[key]) if key in self._overlay else MISSING
+        frame.entries.append((self, key, record, key in self._deleted))
+
+    def _restore(self, key: str, record: Any, deleted: bool) -> None:
+        self._bump(key)
+        if record is MISSING:
+            self._overlay.pop(key, None)
+        else:
+            self._overlay[key] = record
+        if deleted:
+            self._deleted.add(key)
+        else:
+            self._deleted.discard(key)
+
+    def _copy_from(self, other: "CowTable") -> None:
+        self._overlay = {key: copy_json(record) for key, record in other._overlay.items()}
+        self._deleted = set(other._deleted)
+        self._versions = dict(other._versions)
+        self._observations = dict(other._observations)
+
+    def _reset(self) -> None:
+        self._overlay.clear()
+        self._deleted.clear()
+        self._observations.clear()
+
+    def __getitem__(self, key: str) -> Any:
+        if self._journal:
+            self._log(key)
+        if key in self._overlay:
+            # the caller may mutate the record it gets back
+            self._bump(key)
+            return self._overlay[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        record = copy_json(self._base[key])
+        self._bump(key)
+        self._overlay[key] = record
+        return record
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if self._journal:
+            self._log(key)
+        self._bump(key)
+        self._overlay[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self:
+            raise KeyError(key)
+        if self._journal:
+            self._log(key)
+        self._bump(key)
+        self._overlay.pop(key, None)
+        if key in self._base:
+            self._deleted.add(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._overlay or (key in self._base and key not in self._deleted)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self._base:
+            if key not in self._deleted:
+                yield key
+        for key in self._overlay:
+            if key not in self._base:
+                yield key
+
+    def __len__(self) -> int:
+        new = sum(1 for key in self._overlay if key not in self._base)
+        return len(self._base) - len(self._deleted) + new
+
+    def peek(self, key: str) -> Any:
+        """Returns the current record without copying it; the caller must not mutate it."""
+        if key in self._overlay:
+            return self._overlay[key]
+        if key in self._deleted:
+            raise KeyError(key)
+        return self._base[key]
+
+    def dumps(self, key: str) -> str:
+        """`json.dumps` of the current record, cached until the record is next fetched for writing.
+
+        Serializations of untouched records are shared by every episode.
+        """
+        if key in self._overlay:
+            version = self._versions[key]
+            cached = self._observations.get(key)
+            if cached is not None and cached[0] == version:
+                self._observation_stats["hits"] += 1
+                return cached[1]
+            observation = json.dumps(self._overlay[key])
+            self._observations[key] = (version, observation)
+        elif key in self._deleted:
+            raise KeyError(key)
+        else:
+            observation = self._base_observations.get(key)
+            if observation is not None:
+                self._observation_stats["hits"] += 1
+                return observation
+            observation = self._base_observations[key] = json.dumps(self._base[key])
+        self._observation_stats["misses"] += 1
+        return observation
+
+    def values(self) -> Iterator[Any]:
+        for key in self:
+            yield self.peek(key)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        for key in self:
+            yield key, self.peek(key)
+
+    def touched(self) -> Set[str]:
+        """Keys of the records that were fetched for writing, added or deleted."""
+        return set(self._overlay) | self._deleted
+
+    def digest(self) -> int:
+        """An order-independent digest of the table that only rehashes touched records."""
+        entries, total = self._base_digests.get()
+        for key in self.touched():
+            if key in entries:
+                total -= entries[key]
+        for key, record in self._overlay.items():
+            total += record_digest(key, record)
+        return total % DIGEST_MODULUS
+
+
+KeysFunc = Callable[[Any], Iterable[HashableKey]]
+
+
+class TableIndex(object):
+    """A secondary index over a base table, built once and shared by all episodes.
+
+    `keys_func` maps a record to the index keys it is listed under. Lookups on a
+    `CowTable` re-evaluate its touched records live, so the index stays correct
+    whatever the episode wrote, and return record keys in the table's order.
+    """
+
+    def __init__(self, base: Dict[str, Any], keys_func: KeysFunc) -> None:
+        self.keys_func = keys_func
+        self.positions = {key: i for i, key in enumerate(base)}
+        self.entries: Dict[HashableKey, List[str]] = {}
+        for key, record in base.items():
+            for index_key in dict.fromkeys(keys_func(record)):
+                self.entries.setdefault(index_key, []).append(key)
+
+    def lookup(self, table: CowTable, index_key: HashableKey) -> List[str]:
+        touched = table.touched()
+        keys = self.entries.get(index_key, [])
+        if not touched:
+            return list(keys)
+        keys = [key for key in keys if key not in touched]
+        matches = [
+            key
+            for key in touched
+            if key in table and index_key in self.keys_func(table.peek(key))
+        ]
+        if matches:
+            overlay_positions = {key: i for i, key in enumerate(table._overlay)}
+            keys = sorted(
+                keys + matches,
+                key=lambda key: self.positions.get(
+                    key, len(self.positions) + overlay_positions.get(key, 0)
+                ),
+            )
+        return keys
+
+
+class JournalFrame(object):
+    def __init__(self) -> None:
+        self.entries: List[Tuple[CowTable, str, Any, bool]] = []
+        self.logged: Set[Tuple[int, str]] = set()
+
+
+class Database(dict):
+    """The per-episode `data` dict handed to tools, mapping table names to `CowTable`s.
+
+    Writes are journaled per checkpoint, so rolling back costs time proportional
+    to the number of records written since the checkpoint, not to the size of
+    the database.
+    """
+
+    def __init__(self, snapshot: "Snapshot") -> None:
+        self.snapshot = snapshot
+        self.journal: List[JournalFrame] = []
+        self.observation_stats = {"hits": 0, "misses": 0}
+        super().__init__(
+            {
+                name: CowTable(
+                    table,
+                    snapshot.digests[name],
+                    self.journal,
+                    snapshot.observations[name],
+                    self.observation_stats,
+                )
+                for name, table in snapshot.tables.items()
+            }
+        )
+
+    def fork(self) -> "Database":
+        """Returns an independent copy that shares the base snapshot and only copies touched records."""
+        child = Database(self.snapshot)
+        for name, table in self.items():
+            child[name]._copy_from(table)
+        return child
+
+    def checkpoint(self) -> int:
+        """Opens a checkpoint and returns its id, to be passed to `rollback` or `commit`."""
+        self.journal.append(JournalFrame())
+        return len(self.journal)
+
+    def rollback(self, checkpoint: Optional[int] = None) -> None:
+        """Restores the state at `checkpoint` (or the base snapshot) and closes the checkpoints after it.
+
+        Rolling back to the base snapshot also starts the observation cache counts afresh.
+        """
+        if checkpoint is None:
+            for table in self.values():
+                table._reset()
+            self.journal.clear()
+            # the tables share this dict, so it is cleared in place
+            self.observation_stats["hits"] = 0
+            self.observation_stats["misses"] = 0
+            return
+        if not 1 <= checkpoint <= len(self.journal):
+            raise ValueError(f"Unknown checkpoint {checkpoint}")
+        while len(self.journal) >= checkpoint:
+            frame = self.journal.pop()
+            for table, key, record, deleted in reversed(frame.entries):
+                table._restore(key, record, deleted)
+
+    def commit(self, checkpoint: int) -> None:
+        """Closes `checkpoint` and the checkpoints after it, keeping their writes."""
+        if not 1 <= checkpoint <= len(self.journal):
+            raise ValueError(f"Unknown checkpoint {checkpoint}")
+        while len(self.journal) >= checkpoint:
+            frame = self.journal.pop()
+            if not self.journal:
+                break
+            # the enclosing checkpoint must still be able to undo these writes
+            parent = self.journal[-1]
+            for entry in frame.entries:
+                table, key = entry[0], entry[1]
+                if (id(table), key) not in parent.logged:
+                    parent.logged.add((id(table), key))
+                    parent.entries.append(entry)
+
+    def touched(self) -> Dict[str, Set[str]]:
+        return {name: table.touched() for name, table in self.items()}
+
+    def diff(self, other: "Database") -> List[str]:
+        """The paths at which this database differs from `other`, a checkout of the same snapshot.
+
+        Only the records touched on either side are compared, since all the
+        others are still the shared base records.
+        """
+        out: List[str] = []
+        for name in sorted(self):
+            table, other_table = self[name], other[name]
+            for key in sorted(table.touched() | other_table.touched()):
+                if key in table and key in other_table:
+                    diff_values(table.peek(key), other_table.peek(key), f"{name}/{key}", out)
+                elif key in table or key in other_table:
+                    out.append(f"{name}/{key}")
+        return out
+
+    def digest(self) -> str:
+        h = sha256()
+        for name in sorted(self):
+            h.update(f"{name}:{self[name].digest():064x};".encode("utf-8"))
+        return h.hexdigest()
+
+
+class Snapshot(object):
+    """An immutable, in-memory copy of a mock database shared by all episodes."""
+
+    def __init__(self, data: Dict[str, Dict[str, Any]]) -> None:
+        self.tables = data
+        self.digests = {name: BaseDigests(table) for name, table in data.items()}
+        self.observations: Dict[str, Dict[str, str]] = {name: {} for name in data}
+        self.derived_data: Dict[HashableKey, Any] = {}
+        self.derived_data_lock = threading.Lock()
+
+    def checkout(self) -> Database:
+        return Database(self)
+
+    def derived(self, key: HashableKey, build: Callable[[], Any]) -> Any:
+        """Data derived from the base tables (e.g. an index), built by `build` the first time `key` is requested."""
+        with self.derived_data_lock:
+            if key not in self.derived_data:
+                self.derived_data[key] = build()
+            return self.derived_data[key]
+
+    def index(self, table_name: str, keys_func: KeysFunc) -> TableIndex:
+        """The index of `table_name` by `keys_func`, built on first request."""
+        return self.derived(
+            ("index", table_name, keys_func),
+            lambda: TableIndex(self.tables[table_name], keys_func),
+        )
+
+
+def dumps_record(data: Dict[str, Any], table_name: str, key: str) -> str:
+    """`json.dumps(data[table_name][key])`, served from the observation cache for a `Database`."""
+    if isinstance(data, Database):
+        return data[table_name].dumps(key)
+    return json.dumps(data[table_name][key])
+
+
+def lookup_records(
+    data: Dict[str, Any], table_name: str, keys_func: KeysFunc, index_key: HashableKey
+) -> List[Tuple[str, Any]]:
+    """The `(key, record)` pairs of `data[table_name]` listed under `index_key`, in table order.
+
+    The records are not copied and must be treated as read-only. Plain dicts
+    (e.g. data built by hand) are scanned linearly.
+    """
+    if isinstance(data, Database):
+        table = data[table_name]
+        index = data.snapshot.index(table_name, keys_func)
+        return [(key, table.peek(key)) for key in index.lookup(table, index_key)]
+    return [
+        (key, record)
+        for key, record in data[table_name].items()
+        if index_key in keys_func(record)
+    ]
+
+
+_snapshots: Dict[Callable[[], Dict[str, Any]], Snapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def load_snapshot(data_load_func: Callable[[], Dict[str, Any]]) -> Snapshot:
+    """Loads the base snapshot for `data_load_func` once per process."""
+    with _snapshots_lock:
+        if data_load_func not in _snapshots:
+            _snapshots[data_load_func] = Snapshot(data_load_func())
+        return _snapshots[data_load_func]
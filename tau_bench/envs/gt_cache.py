@@ -0,0 +1,154 @@
+# Copyright Sierra
+
+import argparse
+import glob
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from tau_bench.envs.tool import Tool
+from tau_bench.types import Task
+
+# bump whenever the format of the cache file changes
+CACHE_VERSION = 2
+CACHE_DIR = os.environ.get(
+    "TAU_BENCH_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "tau_bench")
+)
+# the code that replays the ground-truth actions and hashes the resulting data
+REPLAY_SOURCES = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+    for name in ["base.py", "db.py", "tool_schema.py", "tool_registry.py"]
+]
+
+
+def fingerprint(
+    data_load_func: Callable[[], Dict[str, Any]],
+    tools: List[Type[Tool]],
+    env_file: Optional[str] = None,
+) -> str:
+    """Hashes the JSON data files next to `data_load_func`, the source files of `tools`,
+    the replay and hashing code, and the env module at `env_file` (which sets its
+    `terminate_tools`)."""
+    data_dir = os.path.dirname(inspect.getfile(data_load_func))
+    paths = sorted(glob.glob(os.path.join(data_dir, "*.json")))
+    paths += sorted(set(inspect.getfile(tool) for tool in tools))
+    paths += REPLAY_SOURCES
+    if env_file is not None:
+        paths.append(env_file)
+    h = hashlib.sha256()
+    for path in paths:
+        h.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def task_digest(task: Task) -> str:
+    actions = [action.model_dump() for action in task.actions]
+    return hashlib.sha256(json.dumps(actions, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class GroundTruthHashCache(object):
+    """An on-disk cache of the ground-truth data hash of every task in a split.
+
+    Entries are keyed by task index and checked against a digest of the task's
+    actions. The file name embeds the cache version and a fingerprint of the
+    data files, the tool code and the replay code, so any change to them starts a
+    fresh cache.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, str]] = self._read()
+
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.path, "r") as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if content.get("version") != CACHE_VERSION:
+            return {}
+        return content.get("tasks", {})
+
+    def get(self, task_index: int, task: Task) -> Optional[str]:
+        entry = self.entries.get(str(task_index))
+        if entry is None or entry["actions"] != task_digest(task):
+            return None
+        return entry["gt_data_hash"]
+
+    def put(self, task_index: int, task: Task, gt_data_hash: str) -> None:
+        self.update({task_index: (task, gt_data_hash)})
+
+    def update(self, items: Dict[int, Tuple[Task, str]]) -> None:
+        with self.lock:
+            # merge with entries written by other processes since we last read the file
+            entries = {**self._read(), **self.entries}
+            for task_index, (task, gt_data_hash) in items.items():
+                entries[str(task_index)] = {
+                    "actions": task_digest(task),
+                    "gt_data_hash": gt_data_hash,
+                }
+            self.entries = entries
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path))
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"version": CACHE_VERSION, "tasks": entries}, f)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                # an unwritable cache directory only costs us the persistence
+                pass
+
+
+_caches: Dict[Tuple[str, str], GroundTruthHashCache] = {}
+_caches_lock = threading.Lock()
+
+
+def load_gt_hash_cache(
+    env_name: str,
+    task_split: str,
+    data_load_func: Callable[[], Dict[str, Any]],
+    tools: List[Type[Tool]],
+    env_file: Optional[str] = None,
+) -> GroundTruthHashCache:
+    with _caches_lock:
+        key = (env_name, task_split)
+        if key not in _caches:
+            path = os.path.join(
+                CACHE_DIR,
+                "gt_data_hash",
+                f"{env_name}-{task_split}-v{CACHE_VERSION}-{fingerprint(data_load_func, tools, env_file)[:16]}.json",
+            )
+            _caches[key] = GroundTruthHashCache(path)
+        return _caches[key]
+
+
+def main() -> None:
+    from tau_bench.envs import get_env
+
+    parser = argparse.ArgumentParser(
+        description="Precompute the ground-truth data hashes of a task split"
+    )
+    parser.add_argument("--env", type=str, choices=["retail", "airline"], default="retail")
+    parser.add_argument("--task-split", type=str, choices=["train", "test", "dev"], default="test")
+    args = parser.parse_args()
+    env = get_env(
+        args.env, user_strategy="human", user_model="gpt-4o", task_split=args.task_split
+    )
+    items = {}
+    for task_index, task in enumerate(env.tasks):
+        env.task_index, env.task = task_index, task
+        gt_data_hash = env.gt_hash_cache.get(task_index, task)
+        items[task_index] = (task, gt_data_hash or env.compute_gt_data_hash())
+    env.gt_hash_cache.update(items)
+    print(f"Cached {len(items)} ground-truth hashes in {env.gt_hash_cache.path}")
+
+
+if __name__ == "__main__":
+    main()
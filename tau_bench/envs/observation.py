@@ -0,0 +1,46 @@
+# Copyright Sierra
+
+import json
+from functools import lru_cache
+from typing import Any, Tuple
+
+# "compact" drops the spaces after separators, "omit-empty" drops null and
+# empty fields of objects, and "sort-keys" orders object keys
+OBSERVATION_ENCODING_OPTIONS = ["compact", "omit-empty", "sort-keys"]
+
+
+def omit_empty(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            k: omit_empty(v) for k, v in value.items() if v is not None and v != "" and v != [] and v != {}
+        }
+    elif isinstance(value, list):
+        return [omit_empty(v) for v in value]
+    return value
+
+
+def encode_observation(observation: str, options: Tuple[str, ...]) -> str:
+    """Re-encodes a JSON object or array observation with `options`; anything else is returned as is."""
+    if not options:
+        return observation
+    return _encode(observation, options)
+
+
+@lru_cache(maxsize=4096)
+def _encode(observation: str, options: Tuple[str, ...]) -> str:
+    # cached on the observation string, which is cheap to look up for the
+    # records served from the observation cache since the same string object
+    # keeps its hash
+    if not observation or observation[0] not in "[{":
+        return observation
+    try:
+        value = json.loads(observation)
+    except ValueError:
+        return observation
+    if "omit-empty" in options:
+        value = omit_empty(value)
+    return json.dumps(
+        value,
+        separators=(",", ":") if "compact" in options else None,
+        sort_keys="sort-keys" in options,
+    )
@@ -1,11 +1,12 @@
 # Copyright Sierra
 
 from tau_bench.envs.base import Env
+from tau_bench.envs.gt_cache import load_gt_hash_cache
 from tau_bench.envs.retail.data import load_data
 from tau_bench.envs.retail.rules import RULES
 from tau_bench.envs.retail.tools import ALL_TOOLS
 from tau_bench.envs.retail.wiki import WIKI
-from typing import Optional, Union
+from typing import Optional, Tuple, Union
 from tau_bench.envs.user import UserStrategy
 
 
@@ -17,6 +18,8 @@ class MockRetailDomainEnv(Env):
         user_provider: Optional[str] = None,
         task_split: str = "test",
         task_index: Optional[int] = None,
+        reward_mode: str = "hash",
+        observation_encoding: Tuple[str, ...] = (),
     ):
         match task_split:
             case "test":
@@ -37,5 +40,14 @@ class MockRetailDomainEnv(Env):
             user_model=user_model,
             user_provider=user_provider,
             task_index=task_index,
+            reward_mode=reward_mode,
+            observation_encoding=observation_encoding,
         )
         self.terminate_tools = ["transfer_to_human_agents"]
+        self.gt_hash_cache = load_gt_hash_cache(
+            env_name="retail",
+            task_split=task_split,
+            data_load_func=load_data,
+            tools=ALL_TOOLS,
+            env_file=__file__,
+        )
@@ -0,0 +1,69 @@
+# Copyright Sierra
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from tau_bench.envs.db import Database, lookup_records
+
+
+def email_keys(user: Dict[str, Any]) -> List[str]:
+    return [user["email"].lower()]
+
+
+def name_zip_keys(user: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    return [
+        (
+            user["name"]["first_name"].lower(),
+            user["name"]["last_name"].lower(),
+            user["address"]["zip"],
+        )
+    ]
+
+
+def find_user_id_by_email(data: Dict[str, Any], email: str) -> Optional[str]:
+    """The first user (in table order) whose email matches `email` case-insensitively."""
+    matches = lookup_records(data, "users", email_keys, email.lower())
+    return matches[0][0] if matches else None
+
+
+def find_user_id_by_name_zip(
+    data: Dict[str, Any], first_name: str, last_name: str, zip: str
+) -> Optional[str]:
+    """The first user (in table order) with the given case-insensitive name and zip code."""
+    matches = lookup_records(
+        data, "users", name_zip_keys, (first_name.lower(), last_name.lower(), zip)
+    )
+    return matches[0][0] if matches else None
+
+
+def build_product_types(products: Dict[str, Dict[str, Any]]) -> str:
+    product_dict = {
+        product["name"]: product["product_id"] for product in products.values()
+    }
+    product_dict = dict(sorted(product_dict.items()))
+    return json.dumps(product_dict)
+
+
+def product_types(data: Dict[str, Any]) -> str:
+    """The JSON listing of product names to product ids.
+
+    On a `Database` it is computed once per base snapshot and reused as long as
+    the episode has not changed the name or id of a product, or added or
+    deleted one.
+    """
+    if isinstance(data, Database):
+        products = data["products"]
+        base = data.snapshot.tables["products"]
+
+        def projection(product: Optional[Dict[str, Any]]) -> Optional[Tuple[str, str]]:
+            return None if product is None else (product["name"], product["product_id"])
+
+        if all(
+            projection(base.get(key))
+            == projection(products.peek(key) if key in products else None)
+            for key in products.touched()
+        ):
+            return data.snapshot.derived(
+                "retail_product_types", lambda: build_product_types(base)
+            )
+    return build_product_types(data["products"])
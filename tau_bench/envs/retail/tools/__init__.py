@@ -16,23 +16,26 @@ from .modify_user_address import ModifyUserAddress
 from .return_delivered_order_items import ReturnDeliveredOrderItems
 from .think import Think
 from .transfer_to_human_agents import TransferToHumanAgents
+from tau_bench.envs.tool_registry import ToolRegistry
 
 
-ALL_TOOLS = [
-    Calculate,
-    CancelPendingOrder,
-    ExchangeDeliveredOrderItems,
-    FindUserIdByEmail,
-    FindUserIdByNameZip,
-    GetOrderDetails,
-    GetProductDetails,
-    GetUserDetails,
-    ListAllProductTypes,
-    ModifyPendingOrderAddress,
-    ModifyPendingOrderItems,
-    ModifyPendingOrderPayment,
-    ModifyUserAddress,
-    ReturnDeliveredOrderItems,
-    Think,
-    TransferToHumanAgents,
-]
+ALL_TOOLS = ToolRegistry(
+    [
+        Calculate,
+        CancelPendingOrder,
+        ExchangeDeliveredOrderItems,
+        FindUserIdByEmail,
+        FindUserIdByNameZip,
+        GetOrderDetails,
+        GetProductDetails,
+        GetUserDetails,
+        ListAllProductTypes,
+        ModifyPendingOrderAddress,
+        ModifyPendingOrderItems,
+        ModifyPendingOrderPayment,
+        ModifyUserAddress,
+        ReturnDeliveredOrderItems,
+        Think,
+        TransferToHumanAgents,
+    ]
+)
@@ -1,16 +1,18 @@
 # Copyright Sierra
 
-import json
 from typing import Any, Dict
+from tau_bench.envs.db import dumps_record
 from tau_bench.envs.tool import Tool
 
 
 class GetUserDetails(Tool):
+    read_only = True
+
     @staticmethod
     def invoke(data: Dict[str, Any], user_id: str) -> str:
         users = data["users"]
         if user_id in users:
-            return json.dumps(users[user_id])
+            return dumps_record(data, "users", user_id)
         return "Error: user not found"
 
     @staticmethod
@@ -1,19 +1,16 @@
 # Copyright Sierra
 
-import json
 from typing import Any, Dict
+from tau_bench.envs.retail.indexes import product_types
 from tau_bench.envs.tool import Tool
 
 
 class ListAllProductTypes(Tool):
+    read_only = True
+
     @staticmethod
     def invoke(data: Dict[str, Any]) -> str:
-        products = data["products"]
-        product_dict = {
-            product["name"]: product["product_id"] for product in products.values()
-        }
-        product_dict = dict(sorted(product_dict.items()))
-        return json.dumps(product_dict)
+        return product_types(data)
 
     @staticmethod
     def get_info() -> Dict[str, Any]:
@@ -0,0 +1,64 @@
+# Copyright Sierra
+
+import mmap
+import threading
+from collections.abc import Sequence
+from typing import Dict, List, Union
+
+from tau_bench.types import Task
+
+
+class TaskCatalog(Sequence):
+    """A read-only list of tasks backed by a JSON Lines file with one task per line.
+
+    The file is memory-mapped and only indexed by line offsets up front; a task
+    is parsed into a `Task` the first time it is accessed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets: List[int] = []
+        start = 0
+        while start < len(self._content):
+            end = self._content.find(b"\n", start)
+            if end == -1:
+                end = len(self._content)
+            if end > start:
+                self._offsets.append(start)
+            start = end + 1
+        self._tasks: Dict[int, Task] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Task, List[Task]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("task index out of range")
+        task = self._tasks.get(index)
+        if task is None:
+            start = self._offsets[index]
+            end = self._content.find(b"\n", start)
+            line = self._content[start : end if end != -1 else len(self._content)]
+            task = Task.model_validate_json(line)
+            with self._lock:
+                task = self._tasks.setdefault(index, task)
+        return task
+
+
+_catalogs: Dict[str, TaskCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def load_task_catalog(path: str) -> TaskCatalog:
+    """Opens the catalog at `path` once per process."""
+    with _catalogs_lock:
+        if path not in _catalogs:
+            _catalogs[path] = TaskCatalog(path)
+        return _catalogs[path]
@@ -3,6 +3,9 @@ from typing import Any
 
 
 class Tool(abc.ABC):
+    # read-only tools never write to `data`, so `Env.step_batch` may run them concurrently
+    read_only = False
+
     @staticmethod
     def invoke(*args, **kwargs):
         raise NotImplementedError
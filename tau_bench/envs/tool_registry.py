@@ -0,0 +1,38 @@
+# Copyright Sierra
+
+import copy
+from collections.abc import Sequence
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Type, Union
+
+from tau_bench.envs.tool import Tool
+from tau_bench.envs.tool_schema import Validator, compile_tool_validator
+
+
+class ToolRegistry(Sequence):
+    """An immutable list of the tools of a domain, with their names, schemas,
+    dispatch table and argument validators computed once and shared by every
+    env. Each caller of `tools_info` gets its own copy of the schemas."""
+
+    def __init__(self, tools: Iterable[Type[Tool]]) -> None:
+        self.tools = tuple(tools)
+        self.infos = tuple(tool.get_info() for tool in self.tools)
+        self.names = tuple(info["function"]["name"] for info in self.infos)
+        self.tools_map: Mapping[str, Type[Tool]] = MappingProxyType(
+            dict(zip(self.names, self.tools))
+        )
+        self.validators: Mapping[str, Validator] = MappingProxyType(
+            {name: compile_tool_validator(tool) for name, tool in self.tools_map.items()}
+        )
+
+    @property
+    def tools_info(self) -> List[Dict[str, Any]]:
+        # a deep copy, so that an env or agent editing its tools cannot change
+        # them for the others
+        return copy.deepcopy(list(self.infos))
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        return self.tools[index]
+
+    def __len__(self) -> int:
+        return len(self.tools)
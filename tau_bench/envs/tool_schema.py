@@ -0,0 +1,131 @@
+# Copyright Sierra
+
+from typing import Any, Callable, Dict, List, Type
+
+from tau_bench.envs.tool import Tool
+from tau_bench.types import ArgumentError
+
+# appends the errors of a value at a path to a list
+Check = Callable[[Any, str, List[ArgumentError]], None]
+Validator = Callable[[Dict[str, Any]], List[ArgumentError]]
+
+JSON_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "string": lambda value: isinstance(value, str),
+    # bool is a subclass of int, but not a JSON number; like JSON Schema, 2.0 is an integer
+    "integer": lambda value: (isinstance(value, int) and not isinstance(value, bool))
+    or (isinstance(value, float) and value.is_integer()),
+    "number": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+    "boolean": lambda value: isinstance(value, bool),
+    "array": lambda value: isinstance(value, list),
+    "object": lambda value: isinstance(value, dict),
+    "null": lambda value: value is None,
+}
+
+
+def join_path(path: str, key: Any) -> str:
+    return f"{path}/{key}" if path else str(key)
+
+
+def type_name(value: Any) -> str:
+    for name, is_type in JSON_TYPES.items():
+        if is_type(value):
+            return name
+    return type(value).__name__
+
+
+def compile_schema(schema: Dict[str, Any], allow_unknown_keys: bool = True) -> Check:
+    """Compiles the subset of JSON Schema used by the tool definitions (`type`,
+    `properties`, `required`, `items` and `enum`) into a nest of closures."""
+    checks: List[Check] = []
+    if "type" in schema:
+        expected = schema["type"]
+        is_type = JSON_TYPES[expected]
+
+        def check_type(value: Any, path: str, errors: List[ArgumentError]) -> bool:
+            if not is_type(value):
+                errors.append(
+                    ArgumentError(
+                        path=path, message=f"expected {expected}, got {type_name(value)}"
+                    )
+                )
+                return False
+            return True
+
+    else:
+
+        def check_type(value: Any, path: str, errors: List[ArgumentError]) -> bool:
+            return True
+
+    if "enum" in schema:
+        allowed = schema["enum"]
+
+        def check_enum(value: Any, path: str, errors: List[ArgumentError]) -> None:
+            if value not in allowed:
+                errors.append(
+                    ArgumentError(path=path, message=f"must be one of {allowed}")
+                )
+
+        checks.append(check_enum)
+    if "properties" in schema or "required" in schema:
+        properties = {
+            name: compile_schema(subschema)
+            for name, subschema in schema.get("properties", {}).items()
+        }
+        required = schema.get("required", [])
+
+        def check_object(value: Any, path: str, errors: List[ArgumentError]) -> None:
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if name not in value:
+                    errors.append(
+                        ArgumentError(path=join_path(path, name), message="is required")
+                    )
+            for name, item in value.items():
+                if name in properties:
+                    properties[name](item, join_path(path, name), errors)
+                elif not allow_unknown_keys:
+                    errors.append(
+                        ArgumentError(path=join_path(path, name), message="is not a parameter")
+                    )
+
+        checks.append(check_object)
+    if "items" in schema:
+        check_item = compile_schema(schema["items"])
+
+        def check_array(value: Any, path: str, errors: List[ArgumentError]) -> None:
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    check_item(item, join_path(path, i), errors)
+
+        checks.append(check_array)
+
+    def check(value: Any, path: str, errors: List[ArgumentError]) -> None:
+        if check_type(value, path, errors):
+            for sub_check in checks:
+                sub_check(value, path, errors)
+
+    return check
+
+
+def compile_tool_validator(tool: Type[Tool]) -> Validator:
+    """A validator of the keyword arguments of `tool` against its `get_info()` schema.
+
+    Unknown top-level arguments are rejected, since `invoke` would fail on them.
+    """
+    check = compile_schema(
+        tool.get_info()["function"]["parameters"], allow_unknown_keys=False
+    )
+
+    def validate(kwargs: Dict[str, Any]) -> List[ArgumentError]:
+        errors: List[ArgumentError] = []
+        check(kwargs, "", errors)
+        return errors
+
+    return validate
+
+
+def format_argument_errors(errors: List[ArgumentError]) -> str:
+    return "Error: invalid arguments: " + "; ".join(
+        f"{error.path}: {error.message}" for error in errors
+    )
@@ -1,8 +1,10 @@
 # Copyright Sierra
 
 import abc
+import asyncio
+import copy
 import enum
-from litellm import completion
+from litellm import acompletion, completion
 
 from typing import Optional, List, Dict, Any, Union
 
@@ -22,6 +24,16 @@ class BaseUserSimulationEnv(abc.ABC):
     def get_total_cost(self) -> float:
         raise NotImplementedError
 
+    def fork(self) -> "BaseUserSimulationEnv":
+        return copy.copy(self)
+
+    async def areset(self, instruction: Optional[str] = None) -> str:
+        # users without a native async implementation block a worker thread instead
+        return await asyncio.to_thread(self.reset, instruction)
+
+    async def astep(self, content: str) -> str:
+        return await asyncio.to_thread(self.step, content)
+
 
 class HumanUserSimulationEnv(BaseUserSimulationEnv):
     def reset(self, instruction: str) -> str:
@@ -41,16 +53,31 @@ class LLMUserSimulationEnv(BaseUserSimulationEnv):
         self.model = model
         self.provider = provider
         self.total_cost = 0.0
-        self.reset()
 
     def generate_next_message(self, messages: List[Dict[str, Any]]) -> str:
         res = completion(
             model=self.model, custom_llm_provider=self.provider, messages=messages
         )
-        message = res.choices[0].message
-        self.messages.append(message.model_dump())
+        return self.add_message(self.read_response(res))
+
+    async def agenerate_next_message(self, messages: List[Dict[str, Any]]) -> str:
+        res = await acompletion(
+            model=self.model, custom_llm_provider=self.provider, messages=messages
+        )
+        return self.add_message(self.read_response(res))
+
+    def read_response(self, res: Any) -> Any:
+        """The message of an LLM response; records the cost of the response."""
         self.total_cost = res._hidden_params["response_cost"]
-        return message.content
+        return res.choices[0].message
+
+    def add_message(self, message: Any) -> str:
+        """Appends a generated message to the conversation; returns what is sent to the agent."""
+        self.messages.append(message.model_dump())
+        return self.parse_response(message.content)
+
+    def parse_response(self, response: str) -> str:
+        return response
 
     def build_system_prompt(self, instruction: Optional[str]) -> str:
         instruction_display = (
@@ -67,29 +94,42 @@ Rules:
 - Do not repeat the exact instruction in the conversation. Instead, use your own words to convey the same information.
 - Try to make the conversation as natural as possible, and stick to the personalities in the instruction."""
 
-    def reset(self, instruction: Optional[str] = None) -> str:
-        self.messages = [
+    def initial_messages(self, instruction: Optional[str]) -> List[Dict[str, Any]]:
+        return [
             {
                 "role": "system",
                 "content": self.build_system_prompt(instruction=instruction),
             },
             {"role": "user", "content": "Hi! How can I help you today?"},
         ]
+
+    def reset(self, instruction: Optional[str] = None) -> str:
+        self.messages = self.initial_messages(instruction)
         return self.generate_next_message(self.messages)
 
     def step(self, content: str) -> str:
         self.messages.append({"role": "user", "content": content})
         return self.generate_next_message(self.messages)
 
+    async def areset(self, instruction: Optional[str] = None) -> str:
+        self.messages = self.initial_messages(instruction)
+        return await self.agenerate_next_message(self.messages)
+
+    async def astep(self, content: str) -> str:
+        self.messages.append({"role": "user", "content": content})
+        return await self.agenerate_next_message(self.messages)
+
     def get_total_cost(self) -> float:
         return self.total_cost
 
+    def fork(self) -> "LLMUserSimulationEnv":
+        # messages are never mutated once appended, so the branches share them
+        user = copy.copy(self)
+        user.messages = list(self.messages)
+        return user
 
-class ReactUserSimulationEnv(LLMUserSimulationEnv):
-    def __init__(self, model: str, provider: str) -> None:
-        super().__init__(model=model, provider=provider)
-        self.reset()
 
+class ReactUserSimulationEnv(LLMUserSimulationEnv):
     def build_system_prompt(self, instruction: Optional[str]) -> str:
         instruction_display = (
             ("\n\nInstruction: " + instruction + "\n")
@@ -114,25 +154,6 @@ Thought:
 User Response:
 <the user response (this will be parsed and sent to the agent)>"""
 
-    def generate_next_message(self, messages: List[Dict[str, Any]]) -> str:
-        res = completion(
-            model=self.model, custom_llm_provider=self.provider, messages=messages
-        )
-        message = res.choices[0].message
-        self.messages.append(message.model_dump())
-        self.total_cost = res._hidden_params["response_cost"]
-        return self.parse_response(message.content)
-
-    def reset(self, instruction: Optional[str] = None) -> str:
-        self.messages = [
-            {
-                "role": "system",
-                "content": self.build_system_prompt(instruction=instruction),
-            },
-            {"role": "user", "content": "Hi! How can I help you today?"},
-        ]
-        return self.generate_next_message(self.messages)
-
     def parse_response(self, response: str) -> str:
         if "###STOP###" in response:
             return "###STOP###"
@@ -145,20 +166,11 @@ User Response:
         else:
             raise ValueError(f"Invalid response format: {response}")
 
-    def step(self, content: str) -> str:
-        self.messages.append({"role": "user", "content": content})
-        return self.generate_next_message(self.messages)
-
-    def get_total_cost(self) -> float:
-        return self.total_cost
-
 
 class VerifyUserSimulationEnv(LLMUserSimulationEnv):
     def __init__(self, model: str, provider: str, max_attempts: int = 3) -> None:
-        self.model = model
-        self.provider = provider
+        super().__init__(model=model, provider=provider)
         self.max_attempts = max_attempts
-        self.reset()
 
     def generate_next_message(self, messages: List[Dict[str, Any]]) -> str:
         attempts = 0
@@ -167,31 +179,26 @@ class VerifyUserSimulationEnv(LLMUserSimulationEnv):
             res = completion(
                 model=self.model, custom_llm_provider=self.provider, messages=messages
             )
-            cur_message = res.choices[0].message
-            self.total_cost = res._hidden_params["response_cost"]
+            cur_message = self.read_response(res)
             if verify(self.model, self.provider, cur_message, messages):
-                self.messages.append(cur_message.model_dump())
-                return cur_message.content
+                return self.add_message(cur_message)
             attempts += 1
         assert cur_message is not None
         return cur_message.content
 
-    def reset(self, instruction: Optional[str] = None) -> str:
-        self.messages = [
-            {
-                "role": "system",
-                "content": self.build_system_prompt(instruction=instruction),
-            },
-            {"role": "user", "content": "Hi! How can I help you today?"},
-        ]
-        return self.generate_next_message(self.messages)
-
-    def step(self, content: str) -> str:
-        self.messages.append({"role": "user", "content": content})
-        return self.generate_next_message(self.messages)
-
-    def get_total_cost(self) -> float:
-        return self.total_cost
+    async def agenerate_next_message(self, messages: List[Dict[str, Any]]) -> str:
+        attempts = 0
+        cur_message = None
+        while attempts < self.max_attempts:
+            res = await acompletion(
+                model=self.model, custom_llm_provider=self.provider, messages=messages
+            )
+            cur_message = self.read_response(res)
+            if await averify(self.model, self.provider, cur_message, messages):
+                return self.add_message(cur_message)
+            attempts += 1
+        assert cur_message is not None
+        return cur_message.content
 
 
 def map_role_label(role: str) -> str:
@@ -203,9 +210,7 @@ def map_role_label(role: str) -> str:
         return role.capitalize()
 
 
-def verify(
-    model: str, provider: str, response: str, messages: List[Dict[str, Any]]
-) -> bool:
+def build_verify_prompt(response: str, messages: List[Dict[str, Any]]) -> str:
     transcript = "\n".join(
         [
             f"{map_role_label(message['role'])}: {message['content']}"
@@ -224,17 +229,36 @@ Your answer will be parsed, so do not include any other text than the classifica
 -----
 
 Classification:"""
+    return prompt
+
+
+def parse_verification(content: str) -> bool:
+    return "true" in content.lower()
+
+
+def verify(
+    model: str, provider: str, response: str, messages: List[Dict[str, Any]]
+) -> bool:
     res = completion(
         model=model,
         custom_llm_provider=provider,
-        messages=[{"role": "user", "content": prompt}],
+        messages=[{"role": "user", "content": build_verify_prompt(response, messages)}],
     )
-    return "true" in res.choices[0].message.content.lower()
+    return parse_verification(res.choices[0].message.content)
 
 
-def reflect(
+async def averify(
     model: str, provider: str, response: str, messages: List[Dict[str, Any]]
-) -> str:
+) -> bool:
+    res = await acompletion(
+        model=model,
+        custom_llm_provider=provider,
+        messages=[{"role": "user", "content": build_verify_prompt(response, messages)}],
+    )
+    return parse_verification(res.choices[0].message.content)
+
+
+def build_reflect_prompt(response: str, messages: List[Dict[str, Any]]) -> str:
     transcript = "\n".join(
         [
             f"{map_role_label(message['role'])}: {message['content']}"
@@ -258,21 +282,40 @@ Reflection:
 
 Response:
 <the response (this will be parsed and sent to the agent)>"""
+    return prompt
+
+
+def parse_reflection(content: str) -> str:
+    _, response = content.split("Response:")
+    return response.strip()
+
+
+def reflect(
+    model: str, provider: str, response: str, messages: List[Dict[str, Any]]
+) -> str:
     res = completion(
         model=model,
         custom_llm_provider=provider,
-        messages=[{"role": "user", "content": prompt}],
+        messages=[{"role": "user", "content": build_reflect_prompt(response, messages)}],
     )
-    _, response = res.choices[0].message.content.split("Response:")
-    return response.strip()
+    return parse_reflection(res.choices[0].message.content)
+
+
+async def areflect(
+    model: str, provider: str, response: str, messages: List[Dict[str, Any]]
+) -> str:
+    res = await acompletion(
+        model=model,
+        custom_llm_provider=provider,
+        messages=[{"role": "user", "content": build_reflect_prompt(response, messages)}],
+    )
+    return parse_reflection(res.choices[0].message.content)
 
 
 class ReflectionUserSimulationEnv(LLMUserSimulationEnv):
     def __init__(self, model: str, provider: str, max_attempts: int = 2) -> None:
-        self.model = model
-        self.provider = provider
+        super().__init__(model=model, provider=provider)
         self.max_attempts = max_attempts
-        self.reset()
 
     def generate_next_message(self, messages: List[Dict[str, Any]]) -> str:
         cur_messages = messages.copy()
@@ -291,22 +334,22 @@ class ReflectionUserSimulationEnv(LLMUserSimulationEnv):
             attempts += 1
         return initial_response
 
-    def reset(self, instruction: Optional[str] = None) -> str:
-        self.messages = [
-            {
-                "role": "system",
-                "content": self.build_system_prompt(instruction=instruction),
-            },
-            {"role": "user", "content": "Hi! How can I help you today?"},
-        ]
-        return self.generate_next_message(self.messages)
-
-    def step(self, content: str) -> str:
-        self.messages.append({"role": "user", "content": content})
-        return self.generate_next_message(self.messages)
-
-    def get_total_cost(self) -> float:
-        return self.total_cost
+    async def agenerate_next_message(self, messages: List[Dict[str, Any]]) -> str:
+        cur_messages = messages.copy()
+        initial_response = await super().agenerate_next_message(cur_messages)
+        if await averify(self.model, self.provider, initial_response, cur_messages):
+            return initial_response
+        attempts = 1
+        while attempts < self.max_attempts:
+            new_message = await areflect(
+                self.model, self.provider, initial_response, cur_messages
+            )
+            cur_messages.append({"role": "user", "content": new_message})
+            new_response = await super().agenerate_next_message(cur_messages)
+            if await averify(self.model, self.provider, new_response, cur_messages):
+                return new_response
+            attempts += 1
+        return initial_response
 
 
 class UserStrategy(enum.Enum):
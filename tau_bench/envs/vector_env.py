@@ -0,0 +1,70 @@
+# Copyright Sierra
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+from tau_bench.envs.base import Env
+from tau_bench.types import Action, EnvResetResponse, EnvResponse, RESPOND_ACTION_NAME
+
+
+class VectorEnv(object):
+    """Drives `num_envs` independent episodes of `env` in lockstep from a single loop.
+
+    Tool calls are executed inline, one pass over the batch. Only the user
+    simulator turns (`respond` actions and resets), which wait on an LLM, are
+    spread over a thread pool of `max_user_workers` threads.
+    """
+
+    def __init__(self, env: Env, num_envs: int, max_user_workers: int = 1) -> None:
+        self.envs = [env.new_episode() for _ in range(num_envs)]
+        self.max_user_workers = max_user_workers
+        self.executor = (
+            ThreadPoolExecutor(max_workers=max_user_workers)
+            if max_user_workers > 1
+            else None
+        )
+
+    @property
+    def num_envs(self) -> int:
+        return len(self.envs)
+
+    def _map(self, func, items: Sequence) -> List:
+        if self.executor is None or len(items) <= 1:
+            return [func(item) for item in items]
+        return list(self.executor.map(func, items))
+
+    def reset(
+        self, task_indices: Sequence[Optional[int]]
+    ) -> List[EnvResetResponse]:
+        if len(task_indices) != self.num_envs:
+            raise ValueError(
+                f"Expected {self.num_envs} task indices, got {len(task_indices)}"
+            )
+        return self._map(
+            lambda i: self.envs[i].reset(task_index=task_indices[i]),
+            range(self.num_envs),
+        )
+
+    def step(self, actions: Sequence[Optional[Action]]) -> List[Optional[EnvResponse]]:
+        """Applies `actions[i]` to episode `i`; a `None` action leaves the episode untouched
+        (e.g. once it is done) and yields a `None` response."""
+        if len(actions) != self.num_envs:
+            raise ValueError(f"Expected {self.num_envs} actions, got {len(actions)}")
+        responses: List[Optional[EnvResponse]] = [None] * self.num_envs
+        user_turns = []
+        for i, action in enumerate(actions):
+            if action is None:
+                continue
+            if action.name == RESPOND_ACTION_NAME:
+                user_turns.append(i)
+            else:
+                responses[i] = self.envs[i].step(action)
+        for i, response in zip(
+            user_turns, self._map(lambda i: self.envs[i].step(actions[i]), user_turns)
+        ):
+            responses[i] = response
+        return responses
+
+    def close(self) -> None:
+        if self.executor is not None:
+            self.executor.shutdown()
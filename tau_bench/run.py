@@ -1,21 +1,36 @@
 # Copyright Sierra
 
 import os
+import queue
+import asyncio
 import json
 import random
 import traceback
-from math import comb
 import multiprocessing
-from typing import List, Dict, Any
+from math import comb
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 
 from tau_bench.envs import get_env
+from tau_bench.envs.base import Env, REWARD_MODES
 from tau_bench.agents.base import Agent
-from tau_bench.types import EnvRunResult, RunConfig
+from tau_bench.checkpoint import (
+    CheckpointWriter,
+    check_checkpoint_path,
+    checkpoint_path_for,
+    load_completed_results,
+    repair_checkpoint,
+    results_path_for,
+    write_results,
+)
+from tau_bench.types import EnvRunResult, RunConfig, SolveResult, ToolProfile
 from litellm import provider_list
 from tau_bench.envs.user import UserStrategy
 
+# "thread" runs an episode per worker thread; "async" drives all episodes from one event loop
+RUNNERS = ["thread", "async"]
+
 
 def run(config: RunConfig) -> List[EnvRunResult]:
     assert config.env in ["retail", "airline"], "Only retail and airline envs are supported"
@@ -24,101 +39,244 @@ def run(config: RunConfig) -> List[EnvRunResult]:
     assert config.agent_strategy in ["tool-calling", "act", "react", "few-shot"], "Invalid agent strategy"
     assert config.task_split in ["train", "test", "dev"], "Invalid task split"
     assert config.user_strategy in [item.value for item in UserStrategy], "Invalid user strategy"
+    assert config.reward_mode in REWARD_MODES, "Invalid reward mode"
+    assert config.runner in RUNNERS, "Invalid runner"
+    assert 0 <= config.shard_index < config.num_shards, "Invalid shard index"
+    assert config.num_processes >= 1, "Invalid number of processes"
 
     random.seed(config.seed)
     time_str = datetime.now().strftime("%m%d%H%M%S")
-    ckpt_path = f"{config.log_dir}/{config.agent_strategy}-{config.model.split('/')[-1]}-{config.temperature}_range_{config.start_index}-{config.end_index}_user-{config.user_model}-{config.user_strategy}_{time_str}.json"
+    if config.resume_from is not None:
+        # results are appended to the checkpoint, so a consolidated .json file
+        # must not be resumed from, and a mistyped path must not start over
+        check_checkpoint_path(config.resume_from)
+        if not os.path.exists(config.resume_from):
+            raise FileNotFoundError(f"Checkpoint to resume from not found: {config.resume_from}")
+        ckpt_path = config.resume_from
+        results_path = results_path_for(ckpt_path)
+    else:
+        shard_str = (
+            f"_shard-{config.shard_index}-of-{config.num_shards}" if config.num_shards > 1 else ""
+        )
+        results_path = f"{config.log_dir}/{config.agent_strategy}-{config.model.split('/')[-1]}-{config.temperature}_range_{config.start_index}-{config.end_index}_user-{config.user_model}-{config.user_strategy}{shard_str}_{time_str}.json"
+        ckpt_path = checkpoint_path_for(results_path, compress=config.compress_checkpoint)
     if not os.path.exists(config.log_dir):
         os.makedirs(config.log_dir)
 
     print(f"Loading user with strategy: {config.user_strategy}")
+    env, agent = build_env_and_agent(config)
+    end_index = (
+        len(env.tasks) if config.end_index == -1 else min(config.end_index, len(env.tasks))
+    )
+    results: List[EnvRunResult] = []
+    if config.resume_from is not None:
+        # errored tasks are run again; their failed results stay in the checkpoint but are ignored
+        repair_checkpoint(ckpt_path)
+        results = load_completed_results(ckpt_path)
+        print(f"Resuming from {ckpt_path}: {len(results)} completed tasks")
+    completed = {(result.task_id, result.trial) for result in results}
+    if config.task_ids and len(config.task_ids) > 0:
+        print(f"Running tasks {config.task_ids} (checkpoint path: {ckpt_path})")
+    else:
+        print(
+            f"Running tasks {config.start_index} to {end_index} (checkpoint path: {ckpt_path})"
+    )
+    # every shard lists the same work items and takes every num_shards-th one
+    work = get_work_items(config, end_index)[config.shard_index :: config.num_shards]
+    work = [item for item in work if item not in completed]
+    if config.num_shards > 1:
+        print(f"Shard {config.shard_index} of {config.num_shards}: {len(work)} tasks to run")
+    if len(work) == 0 and len(results) == 0:
+        # e.g. a shard of a run with fewer work items than shards
+        print("Nothing to run")
+        return results
+    writer = CheckpointWriter(ckpt_path)
+    try:
+        if config.num_processes > 1:
+            results.extend(run_processes(config, work, writer))
+        else:
+            results.extend(run_work_items(config, env, agent, work, writer.write))
+    finally:
+        writer.close()
+
+    display_metrics(results)
+
+    write_results(results_path, results)
+    print(f"\n📄 Results saved to {results_path}\n")
+    return results
+
+
+def build_env_and_agent(config: RunConfig) -> Tuple[Env, Agent]:
     env = get_env(
         config.env,
         user_strategy=config.user_strategy,
         user_model=config.user_model,
         user_provider=config.user_model_provider,
         task_split=config.task_split,
+        reward_mode=config.reward_mode,
+        observation_encoding=tuple(config.observation_encoding),
     )
+    env.profile_tools = config.profile_tools
+    env.max_tool_workers = config.max_tool_workers
     agent = agent_factory(
         tools_info=env.tools_info,
         wiki=env.wiki,
         config=config,
     )
-    end_index = (
-        len(env.tasks) if config.end_index == -1 else min(config.end_index, len(env.tasks))
-    )
-    results: List[EnvRunResult] = []
-    lock = multiprocessing.Lock()
-    if config.task_ids and len(config.task_ids) > 0:
-        print(f"Running tasks {config.task_ids} (checkpoint path: {ckpt_path})")
-    else:
-        print(
-            f"Running tasks {config.start_index} to {end_index} (checkpoint path: {ckpt_path})"
-    )
-    for i in range(config.num_trials):
-        if config.task_ids and len(config.task_ids) > 0:
-            idxs = config.task_ids
+    return env, agent
+
+
+def run_work_items(
+    config: RunConfig,
+    env: Env,
+    agent: Agent,
+    work: List[Tuple[int, int]],
+    on_result: Callable[[EnvRunResult], None],
+) -> List[EnvRunResult]:
+    """Runs the (task_id, trial) pairs in `work` with the configured runner; results are
+    passed to `on_result` as they finish and returned in the order of `work`."""
+
+    def _save(
+        idx: int, trial: int, res: Optional[SolveResult], error: Optional[Exception] = None
+    ) -> EnvRunResult:
+        if error is None:
+            result = EnvRunResult(
+                task_id=idx,
+                reward=res.reward,
+                info=res.info,
+                traj=res.messages,
+                trial=trial,
+            )
         else:
-            idxs = list(range(config.start_index, end_index))
-        if config.shuffle:
-            random.shuffle(idxs)
+            result = EnvRunResult(
+                task_id=idx,
+                reward=0.0,
+                info={
+                    "error": str(error),
+                    "traceback": "".join(
+                        traceback.format_exception(type(error), error, error.__traceback__)
+                    ),
+                },
+                traj=[],
+                trial=trial,
+            )
+        print(
+            "✅" if result.reward == 1 else "❌",
+            f"task_id={idx}",
+            result.info,
+        )
+        print("-----")
+        on_result(result)
+        return result
 
-        def _run(idx: int) -> EnvRunResult:
-            isolated_env = get_env(
-                config.env,
-                user_strategy=config.user_strategy,
-                user_model=config.user_model,
-                task_split=config.task_split,
-                user_provider=config.user_model_provider,
+    def _run(item: Tuple[int, int]) -> EnvRunResult:
+        idx, trial = item
+        isolated_env = env.new_episode(task_index=idx)
+
+        print(f"Running task {idx}")
+        try:
+            res = agent.solve(
+                env=isolated_env,
                 task_index=idx,
             )
+        except Exception as e:
+            return _save(idx, trial, None, e)
+        return _save(idx, trial, res)
+
+    async def _arun(item: Tuple[int, int], semaphore: asyncio.Semaphore) -> EnvRunResult:
+        idx, trial = item
+        async with semaphore:
+            isolated_env = env.new_episode(task_index=idx)
 
             print(f"Running task {idx}")
             try:
-                res = agent.solve(
+                res = await agent.asolve(
                     env=isolated_env,
                     task_index=idx,
                 )
-                result = EnvRunResult(
-                    task_id=idx,
-                    reward=res.reward,
-                    info=res.info,
-                    traj=res.messages,
-                    trial=i,
-                )
             except Exception as e:
-                result = EnvRunResult(
-                    task_id=idx,
-                    reward=0.0,
-                    info={"error": str(e), "traceback": traceback.format_exc()},
-                    traj=[],
-                    trial=i,
+                return _save(idx, trial, None, e)
+            return _save(idx, trial, res)
+
+    async def _arun_all() -> List[EnvRunResult]:
+        # the semaphore must be created inside the running event loop
+        semaphore = asyncio.Semaphore(config.max_concurrency)
+        return await asyncio.gather(*(_arun(item, semaphore) for item in work))
+
+    # all trials share one queue, so the next trial starts while the last tasks of the
+    # previous one are still running
+    if config.runner == "async":
+        return asyncio.run(_arun_all())
+    with ThreadPoolExecutor(max_workers=config.max_concurrency) as executor:
+        return list(executor.map(_run, work))
+
+
+def _run_process(config: RunConfig, work: List[Tuple[int, int]], results: Any) -> None:
+    random.seed(config.seed)
+    env, agent = build_env_and_agent(config)
+    run_work_items(config, env, agent, work, results.put)
+
+
+def run_processes(
+    config: RunConfig, work: List[Tuple[int, int]], writer: CheckpointWriter
+) -> List[EnvRunResult]:
+    """Splits `work` round-robin between `config.num_processes` worker processes.
+
+    The workers send their results back to this process, which writes them to
+    the one checkpoint of the run, so resuming works as for a single process.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    results_queue = ctx.Queue()
+    # --max-concurrency is shared between the processes
+    worker_config = config.model_copy(
+        update={"max_concurrency": -(-config.max_concurrency // config.num_processes)}
+    )
+    processes = [
+        ctx.Process(
+            target=_run_process,
+            args=(worker_config, work[k :: config.num_processes], results_queue),
+            daemon=True,
+        )
+        for k in range(config.num_processes)
+        if len(work[k :: config.num_processes]) > 0
+    ]
+    for process in processes:
+        process.start()
+    results: List[EnvRunResult] = []
+    while len(results) < len(work):
+        try:
+            result = results_queue.get(timeout=1.0)
+        except queue.Empty:
+            if not any(process.is_alive() for process in processes) and results_queue.empty():
+                raise RuntimeError(
+                    f"Worker processes exited with {len(work) - len(results)} tasks left"
                 )
-            print(
-                "✅" if result.reward == 1 else "❌",
-                f"task_id={idx}",
-                result.info,
-            )
-            print("-----")
-            with lock:
-                data = []
-                if os.path.exists(ckpt_path):
-                    with open(ckpt_path, "r") as f:
-                        data = json.load(f)
-                with open(ckpt_path, "w") as f:
-                    json.dump(data + [result.model_dump()], f, indent=2)
-            return result
-
-        with ThreadPoolExecutor(max_workers=config.max_concurrency) as executor:
-            res = list(executor.map(_run, idxs))
-            results.extend(res)
+            continue
+        writer.write(result)
+        results.append(result)
+    for process in processes:
+        process.join()
+    order = {item: i for i, item in enumerate(work)}
+    return sorted(results, key=lambda result: order[(result.task_id, result.trial)])
 
-    display_metrics(results)
 
-    with open(ckpt_path, "w") as f:
-        json.dump([result.model_dump() for result in results], f, indent=2)
-        print(f"\n📄 Results saved to {ckpt_path}\n")
-    return results
+def get_work_items(config: RunConfig, end_index: int) -> List[Tuple[int, int]]:
+    """Lists the (task_id, trial) pairs of a run, trial by trial, in the order they are started.
+
+    Each trial is shuffled in turn from the global random state, which `run` seeds with `config.seed`.
+    """
+    work: List[Tuple[int, int]] = []
+    # given task ids are shuffled in place from one trial to the next, as they always have been
+    task_ids = list(config.task_ids) if config.task_ids and len(config.task_ids) > 0 else None
+    for trial in range(config.num_trials):
+        if task_ids is not None:
+            idxs = task_ids
+        else:
+            idxs = list(range(config.start_index, end_index))
+        if config.shuffle:
+            random.shuffle(idxs)
+        work.extend((idx, trial) for idx in idxs)
+    return work
 
 
 def agent_factory(
@@ -201,3 +359,24 @@ def display_metrics(results: List[EnvRunResult]) -> None:
     print("📈 Pass^k")
     for k, pass_hat_k in pass_hat_ks.items():
         print(f"  k={k}: {pass_hat_k}")
+    display_tool_profile(results)
+
+
+def display_tool_profile(results: List[EnvRunResult]) -> None:
+    profiles: Dict[str, ToolProfile] = {}
+    for result in results:
+        for name, profile in (result.info.get("tool_profile") or {}).items():
+            total = profiles.setdefault(name, ToolProfile())
+            total.calls += profile["calls"]
+            total.time += profile["time"]
+            total.bytes += profile["bytes"]
+            total.tokens += profile["tokens"]
+    if not profiles:
+        return
+    print("🔧 Tool profile (sorted by total tokens)")
+    print(f"  {'tool':34s} {'calls':>7s} {'ms/call':>9s} {'tokens/call':>12s} {'total tokens':>13s}")
+    for name, profile in sorted(profiles.items(), key=lambda item: -item[1].tokens):
+        print(
+            f"  {name:34s} {profile.calls:7d} {profile.time / profile.calls * 1e3:9.3f} "
+            f"{profile.tokens / profile.calls:12.1f} {profile.tokens:13d}"
+        )
@@ -22,11 +22,15 @@ class Task(BaseModel):
 class RewardOutputInfo(BaseModel):
     r_outputs: float
     outputs: Dict[str, bool]
+    # the outcome of the database check, which tasks with outputs are also graded on
+    r_actions: Optional[float] = None
+    data_diff: Optional[List[str]] = None
 
 
 class RewardActionInfo(BaseModel):
     r_actions: float
     gt_data_hash: str
+    data_diff: Optional[List[str]] = None
 
 
 class RewardResult(BaseModel):
@@ -42,11 +46,26 @@ class SolveResult(BaseModel):
     total_cost: Optional[float] = None
 
 
+class ArgumentError(BaseModel):
+    path: str
+    message: str
+
+
+class ToolProfile(BaseModel):
+    calls: int = 0
+    time: float = 0.0
+    bytes: int = 0
+    tokens: int = 0
+
+
 class EnvInfo(BaseModel):
     task: Task
     source: Optional[str] = None
     user_cost: Optional[float] = None
     reward_info: Optional[RewardResult] = None
+    observation_cache: Optional[Dict[str, int]] = None
+    argument_errors: Optional[List[ArgumentError]] = None
+    tool_profile: Optional[Dict[str, ToolProfile]] = None
 
 
 class EnvResponse(BaseModel):
@@ -88,3 +107,13 @@ class RunConfig(BaseModel):
     shuffle: int = 0
     user_strategy: str = "llm"
     few_shot_displays_path: Optional[str] = None
+    reward_mode: str = "hash"
+    profile_tools: bool = False
+    max_tool_workers: int = 1
+    observation_encoding: List[str] = []
+    runner: str = "thread"
+    compress_checkpoint: bool = False
+    resume_from: Optional[str] = None
+    num_shards: int = 1
+    shard_index: int = 0
+    num_processes: int = 1